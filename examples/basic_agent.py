@@ -28,17 +28,14 @@ class EchoAgent(Agent):
 
     def handle_task(self, task: Task) -> Task:
         """Process the task by echoing back the user's message."""
-        # Get the user's message
-        if task.messages:
-            user_message = task.messages[0]
-            if user_message.parts:
-                user_text = user_message.parts[0].content
+        # Get the user's message; a task without one is the rare case, so handle it as an exception
+        try:
+            user_text = task.messages[0].parts[0].content
+        except IndexError:
+            return task.fail("No message to echo")
 
-                # Create a response
-                response = f"Echo: {user_text}"
-                return task.complete(response)
-
-        return task.fail("No message to echo")
+        # Create a response
+        return task.complete(f"Echo: {user_text}")
 
 
 def main():
@@ -52,11 +49,12 @@ def main():
     # Test the agent with direct processing
     test_messages = ["Hello, agent!", "How are you?", "This is a test message"]
 
+    # Collect the transcript and write it in one go rather than one print call per line
+    transcript = []
     for msg in test_messages:
-        print(f"User: {msg}")
         response = agent.process(msg)
-        print(f"Agent: {response}")
-        print()
+        transcript.append(f"User: {msg}\nAgent: {response}\n")
+    print("\n".join(transcript))
 
 
 if __name__ == "__main__":
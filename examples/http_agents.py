@@ -7,13 +7,14 @@ import asyncio
 from protolink.agents import Agent
 from protolink.models import AgentCard, Message, Task
 from protolink.transport import HTTPAgentTransport
+from protolink.utils.runner import run
 
 
 class FriendlyAgent(Agent):
     """Simple agent that replies with a templated message."""
 
     def __init__(self, name: str, description: str, port: int) -> None:
-        transport = HTTPAgentTransport(host="127.0.0.1", port=port, backend="starlette")
+        transport = HTTPAgentTransport(url=f"http://127.0.0.1:{port}", backend="starlette")
         card = AgentCard(name=name, description=description, url=f"http://127.0.0.1:{port}")
         super().__init__(card, transport=transport)
 
@@ -22,6 +23,14 @@ class FriendlyAgent(Agent):
         return task.complete(f"[{self.card.name}] heard: '{user_text}'")
 
 
+async def exchange(sender: FriendlyAgent, receiver: FriendlyAgent, text: str) -> str:
+    """Send ``text`` from ``sender`` to ``receiver`` and return the reply."""
+
+    task = Task.create(Message.user(text))
+    reply = await sender.send_task_to(receiver.card.url, task)
+    return reply.messages[-1].parts[0].content
+
+
 async def main() -> None:
     """Spin up two HTTP agents and send them tasks."""
 
@@ -29,21 +38,29 @@ async def main() -> None:
     bob = FriendlyAgent("bob", "Echoes whatever it receives", port=8011)
 
     await asyncio.gather(alice.start(), bob.start())
+    # Open the connections up front so the first exchange does not pay for the handshake
+    await asyncio.gather(
+        alice.client.transport.warmup([bob.card.url]),
+        bob.client.transport.warmup([alice.card.url]),
+    )
 
     try:
+        # Both exchanges are independent, so run them concurrently and print once both replies are back.
+        bob_reply, alice_reply = await asyncio.gather(
+            exchange(alice, bob, "Hi Bob, how are you?"),
+            exchange(bob, alice, "Hey Alice, got your ping!"),
+        )
+
         print("=== Alice -> Bob ===")
-        hello = Task.create(Message.user("Hi Bob, how are you?"))
-        bob_reply = await alice.send_task_to(bob.card.url, hello)
-        print(bob_reply.messages[-1].parts[0].content)
+        print(bob_reply)
 
         print("\n=== Bob -> Alice ===")
-        ping = Task.create(Message.user("Hey Alice, got your ping!"))
-        alice_reply = await bob.send_task_to(alice.card.url, ping)
-        print(alice_reply.messages[-1].parts[0].content)
+        print(alice_reply)
 
     finally:
         await asyncio.gather(alice.stop(), bob.stop())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Runs on uvloop when installed: pip install "protolink[uvloop]"
+    run(main())
@@ -1,4 +1,11 @@
 import argparse
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from collections.abc import Iterable
+from functools import cache
 from typing import Any, TypeVar
 
 from protolink.models import Message
@@ -6,18 +13,61 @@ from protolink.models import Message
 T = TypeVar("T")
 
 
-def safe_import(module: str, class_name: str) -> type[Any] | None:
-    """Safely import a class, returning None if the module is not available."""
+@cache
+def safe_import(module: str, class_name: str, requires: str | None = None) -> type[Any] | None:
+    """Safely import a class, returning None if the module is not available.
+
+    ``requires`` names the third-party library backing the class. It is probed with ``find_spec`` first, so a missing
+    backend is detected without running the import machinery. Results are cached per arguments.
+    """
+    if requires is not None and importlib.util.find_spec(requires) is None:
+        return None
     try:
-        module = __import__(f"protolink.llms.{module}", fromlist=[class_name])
-        return getattr(module, class_name, None)
+        # The class is a plain module attribute, so a namespace lookup is enough
+        return vars(importlib.import_module(f"protolink.llms.{module}")).get(class_name)
     except ImportError:
         return None
 
 
+def _write_stdout(fd: int | None, text: str) -> None:
+    """Write ``text`` straight to the stdout file descriptor, bypassing the text wrapper when possible."""
+    if fd is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    data = text.encode()
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def print_stream(chunks: Iterable[Any], max_chunks: int = 8, max_delay: float = 0.05) -> None:
+    """Print streamed chunks as they arrive, flushing in batches instead of once per token.
+
+    Output is written when ``max_chunks`` chunks are buffered or ``max_delay`` seconds have passed since the last write.
+    """
+    # Earlier prints must reach the terminal before the raw writes below
+    sys.stdout.flush()
+    try:
+        fd: int | None = sys.stdout.fileno()
+    except (AttributeError, OSError):  # e.g. stdout replaced by a StringIO or a notebook stream
+        fd = None
+
+    buffer: list[str] = []
+    last_write = time.monotonic()
+    for chunk in chunks:
+        buffer.append(chunk.content)
+        now = time.monotonic()
+        if len(buffer) >= max_chunks or now - last_write >= max_delay:
+            _write_stdout(fd, "".join(buffer))
+            buffer.clear()
+            last_write = now
+    if buffer:
+        _write_stdout(fd, "".join(buffer))
+
+
 def test_openai_llm() -> None:
     """Test the OpenAI LLM implementation."""
-    if openai_llm := safe_import("api", "OpenAILLM"):
+    if openai_llm := safe_import("api", "OpenAILLM", "openai"):
         print("\n=== Testing OpenAI LLM ===")
         try:
             llm = openai_llm()
@@ -28,8 +78,7 @@ def test_openai_llm() -> None:
             print(f"Response: {response.content}")
 
             print("\nTesting streaming response:")
-            for chunk in llm.generate_stream_response(messages):
-                print(chunk.content, end="", flush=True)
+            print_stream(llm.generate_stream_response(messages))
             print("\n")
         except Exception as e:
             print(f"Error testing OpenAI: {e}")
@@ -39,7 +88,7 @@ def test_openai_llm() -> None:
 
 def test_anthropic_llm() -> None:
     """Test the Anthropic LLM implementation."""
-    if anthropic_llm := safe_import("api", "AnthropicLLM"):
+    if anthropic_llm := safe_import("api", "AnthropicLLM", "anthropic"):
         print("\n=== Testing Anthropic LLM ===")
         try:
             llm = anthropic_llm()
@@ -50,8 +99,7 @@ def test_anthropic_llm() -> None:
             print(f"Response: {response.content}")
 
             print("\nTesting streaming response:")
-            for chunk in llm.generate_stream_response(messages):
-                print(chunk.content, end="", flush=True)
+            print_stream(llm.generate_stream_response(messages))
             print("\n")
         except Exception as e:
             print(f"Error testing Anthropic: {e}")
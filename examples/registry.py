@@ -1,16 +1,31 @@
 import asyncio
+import logging
+from typing import Any
+
+import httpx
 
 from protolink.agents import Agent
 from protolink.discovery import Registry
 from protolink.models import AgentCard, Message, Task
 from protolink.transport import HTTPAgentTransport
+from protolink.utils.logging import get_logger
+from protolink.utils.runner import run
+
+logger = get_logger(__name__)
 
 
 # ----------------------------------------------------------------------
 # Autonomous Agent Class Extension
 # ----------------------------------------------------------------------
 class AutonomousAgent(Agent):
-    """An agent that autonomously discovers peers and sends a task after a delay."""
+    """An agent that autonomously discovers peers and sends them a task once they are all registered."""
+
+    def __init__(self, *args: Any, peers_ready: asyncio.Event, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._peers_ready = peers_ready
+        self._autonomous_task: asyncio.Task | None = None
+        # Set once the autonomous loop has finished, successfully or not
+        self.done = asyncio.Event()
 
     async def start(self) -> None:
         """Start agent server and autonomous logic."""
@@ -28,7 +43,7 @@ class AutonomousAgent(Agent):
     async def stop(self) -> None:
         """Stop the agent and cancel autonomous task."""
         # Cancel the autonomous background task if it exists
-        if hasattr(self, "_autonomous_task"):
+        if self._autonomous_task is not None:
             self._autonomous_task.cancel()
             try:
                 await self._autonomous_task
@@ -38,21 +53,32 @@ class AutonomousAgent(Agent):
         await super().stop()
 
     async def autonomous_loop(self):
-        """Autonomous loop: wait 10s, discover other agents, send task."""
-        await asyncio.sleep(6)  # wait before acting
-
+        """Autonomous loop: wait for the peers to register, discover them, send each a task."""
+        try:
+            await self._peers_ready.wait()
+            await self._act()
+        finally:
+            self.done.set()
+
+    async def _act(self) -> None:
         print(f"[{self.card.name}] Discovering other agents...")
         agents = await self.discover_agents()
-        peers = [a for a in agents if a.url != self.card.url]
-        print("-------------------")
-        print("Agents Discovered:")
-        for a in agents:
-            print(a)
-        print("-------------------")
+        self_url = self.card.url
+        # Kept as a list: it is walked again to pair each peer with its result
+        peers = [a for a in agents if a.url != self_url]
+        print(f"[{self.card.name}] Discovered {len(agents)} agents")
+        # The full listing grows with the registry, so it is only built when debug logging is on
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Agents Discovered:\n" + "\n".join(str(a) for a in agents))
         for peer in peers:
             print(f"[{self.card.name}] Sending task to {peer.name}")
-            task = Task.create(Message.user(f"Hello from {self.card.name}!"))
-            result_task = await self.send_task_to(peer.url, task)
+        # Send to all peers at once; a failing peer is reported without holding up the others
+        greeting = f"Hello from {self.card.name}!"
+        results = await self.send_tasks_to((peer.url, Task.create(Message.user(greeting))) for peer in peers)
+        for peer, result_task in zip(peers, results, strict=True):
+            if isinstance(result_task, BaseException):
+                print(f"[{self.card.name}] Task to {peer.name} failed: {result_task}")
+                continue
             for msg in result_task.messages:
                 print(f"[{peer.name} -> {self.card.name}] {msg.role}: {msg.parts[0].content}")
 
@@ -70,10 +96,13 @@ async def start_registry() -> Registry:
 # ----------------------------------------------------------------------
 # Setup Agent
 # ----------------------------------------------------------------------
-async def setup_agent(name: str, port: int) -> AutonomousAgent:
+async def setup_agent(
+    name: str, port: int, peers_ready: asyncio.Event, http_client: httpx.AsyncClient
+) -> AutonomousAgent:
     card = AgentCard(name=name, url=f"http://localhost:{port}", description="Does all the work", skills=[])
-    transport = HTTPAgentTransport(url=f"http://localhost:{port}")
-    agent = AutonomousAgent(card=card, transport=transport, registry="http://localhost:9000")
+    # All agents send through the same client, so they share one connection pool
+    transport = HTTPAgentTransport(url=f"http://localhost:{port}", client=http_client)
+    agent = AutonomousAgent(card=card, transport=transport, registry="http://localhost:9000", peers_ready=peers_ready)
     await agent.start()  # starts server and autonomous loop
     print(f"[{name}] Started and registered to registry.")
     return agent
@@ -84,17 +113,25 @@ async def setup_agent(name: str, port: int) -> AutonomousAgent:
 # ----------------------------------------------------------------------
 async def main():
     registry = await start_registry()
-    agent1 = await setup_agent("agent1", 8001)
-    agent2 = await setup_agent("agent2", 8002)
-
-    # Keep the script alive long enough for autonomous actions
-    await asyncio.sleep(40)
-
-    # Cleanup
-    await agent1.stop()
-    await agent2.stop()
+    peers_ready = asyncio.Event()
+
+    async with httpx.AsyncClient() as http_client:
+        # Agents start and register independently of each other
+        agent1, agent2 = await asyncio.gather(
+            setup_agent("agent1", 8001, peers_ready, http_client),
+            setup_agent("agent2", 8002, peers_ready, http_client),
+        )
+
+        # Let the agents act as soon as both are registered, and finish once both are done
+        await registry.wait_for_agents(2, timeout=10)
+        peers_ready.set()
+        await asyncio.wait_for(asyncio.gather(agent1.done.wait(), agent2.done.wait()), timeout=40)
+
+        # Cleanup: agents unregister on stop, so the registry goes down last
+        await asyncio.gather(agent1.stop(), agent2.stop())
     await registry.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Runs on uvloop when installed: pip install "protolink[uvloop]"
+    run(main())
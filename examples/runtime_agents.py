@@ -7,6 +7,7 @@ import asyncio
 from protolink.agents import Agent
 from protolink.models import AgentCard, Message, Task
 from protolink.transport import RuntimeAgentTransport
+from protolink.utils.runner import run
 
 
 class FriendlyAgent(Agent):
@@ -32,18 +33,23 @@ async def main() -> None:
 
     print("=== Runtime Transport Demo ===\n")
 
-    print("Alice -> Bob")
+    # Both exchanges are independent, so run them concurrently and print once both replies are back.
     hello = Task.create(Message.user("Hi Bob, how are you?"))
-    bob_reply = await alice.send_task_to("bob", hello)
+    ping = Task.create(Message.user("Hey Alice, got your ping!"))
+    bob_reply, alice_reply = await asyncio.gather(alice.send_task_to("bob", hello), bob.send_task_to("alice", ping))
+
+    print("Alice -> Bob")
     print(bob_reply.messages[-1].parts[0].content)
 
     print("\nBob -> Alice")
-    ping = Task.create(Message.user("Hey Alice, got your ping!"))
-    alice_reply = await bob.send_task_to("alice", ping)
     print(alice_reply.messages[-1].parts[0].content)
 
-    print("\nRegistered agents:", transport.list_agents())
+    print("\nRegistered agents:")
+    for url, card in transport.get_agent_cards().items():
+        print(f"  {card.name} ({url}): {card.description}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Runs on uvloop when installed: pip install "protolink[uvloop]"
+    # In-memory sends complete without suspending, so eager tasks skip a scheduler round-trip per send
+    run(main(), eager_tasks=True)
@@ -16,7 +16,11 @@ import asyncio
 from protolink.agents import Agent
 from protolink.core.events import TaskArtifactUpdateEvent, TaskProgressEvent, TaskStatusUpdateEvent
 from protolink.models import AgentCard, Artifact, Message, Task
-from protolink.transport import RuntimeTransport
+from protolink.transport import RuntimeAgentTransport
+from protolink.utils.runner import run
+
+# Simulated duration of each analysis step
+STEP_SECONDS = 0.5
 
 
 class StreamingAnalysisAgent(Agent):
@@ -53,16 +57,19 @@ class StreamingAnalysisAgent(Agent):
         user_text = task.messages[0].parts[0].content
         print(f"[Agent] Starting analysis of: {user_text}")
 
-        # Simulate work with progress updates
+        # Simulate work with progress updates. The updates follow a fixed schedule, so each step sleeps until its
+        # deadline on the loop clock; time spent by the consumer between events does not push the schedule back.
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         for step in range(1, 5):
-            await asyncio.sleep(0.5)  # Simulate work
+            await asyncio.sleep(started + step * STEP_SECONDS - loop.time())  # Simulate work
 
             progress = step * 20
             yield TaskProgressEvent(task_id=task.id, progress=progress, message=f"Processing step {step}/4")
             print(f"[Agent] Progress: {progress}%")
 
         # Produce artifact (NEW in v0.2.0)
-        await asyncio.sleep(0.5)
+        await asyncio.sleep(started + 5 * STEP_SECONDS - loop.time())
         artifact = Artifact().add_text(f"Analysis Results for: {user_text}\n\nData processed: 1000 records\nErrors: 0")
         artifact.metadata["type"] = "analysis_result"
 
@@ -79,7 +86,7 @@ async def main():
 
     # Create agent and transport
     agent = StreamingAnalysisAgent()
-    transport = RuntimeTransport()
+    transport = RuntimeAgentTransport()
     transport.register_agent(agent)
 
     # Create task
@@ -129,7 +136,7 @@ async def example_multi_turn():
     print("\n=== ProtoLink v0.2.0: Multi-Turn Context Example ===\n")
 
     agent = StreamingAnalysisAgent()
-    transport = RuntimeTransport()
+    transport = RuntimeAgentTransport()
     transport.register_agent(agent)
 
     # Create a context for multi-turn conversation
@@ -164,8 +171,8 @@ async def example_multi_turn():
 
 
 if __name__ == "__main__":
-    # Run streaming example
-    asyncio.run(main())
+    # Run streaming example (on uvloop when installed: pip install "protolink[uvloop]")
+    run(main())
 
     # Run multi-turn example
-    asyncio.run(example_multi_turn())
+    run(example_multi_turn())
@@ -5,31 +5,64 @@ Simple agent implementation extending Google's A2A protocol making the Agent com
 incorporating both client and server functionalities.
 """
 
+import asyncio
+import inspect
 import time
-from collections.abc import AsyncIterator
-from typing import Any, Literal
+import weakref
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Literal, TypeVar
 
 from protolink.client import AgentClient, RegistryClient
+from protolink.client.agent import SEND_TASKS_MAX_CONCURRENCY
 from protolink.core.context_manager import ContextManager
+from protolink.core.events import TaskArtifactUpdateEvent, TaskErrorEvent, TaskStatusUpdateEvent
 from protolink.discovery.registry import Registry
 from protolink.llms.base import LLM
 from protolink.models import AgentCard, AgentSkill, Message, Task
 from protolink.server import AgentServer
 from protolink.tools import BaseTool, Tool
 from protolink.transport import AgentTransport, HTTPRegistryTransport
+from protolink.utils import fastjson
 from protolink.utils.logging import get_logger
 from protolink.utils.renderers import to_status_html
 
 logger = get_logger(__name__)
 
+# Upper bound on memoized results of cacheable tools; the oldest entry is evicted first
+TOOL_CACHE_MAX_SIZE = 1024
+
+AgentT = TypeVar("AgentT", bound="Agent")
+
+# Agent classes that already logged the missing transport warning, so it is emitted once per class
+_warned_no_transport: weakref.WeakSet[type] = weakref.WeakSet()
+
 
 class Agent:
     """Base class for creating A2A-compatible agents.
 
     Users should subclass this and implement the handle_task method.
     Optionally implement handle_task_streaming for real-time updates.
+
+    The base class declares ``__slots__`` to keep instances compact. Subclasses that do not declare their own
+    ``__slots__`` get a regular ``__dict__`` and can set any attribute as usual.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_card_bytes",
+        "_client",
+        "_server",
+        "_skill_ids",
+        "_tool_cache",
+        "card",
+        "context_manager",
+        "llm",
+        "registry_client",
+        "skills",
+        "start_time",
+        "tools",
+    )
+
     def __init__(
         self,
         card: AgentCard | dict[str, Any],
@@ -53,9 +86,15 @@ class Agent:
 
         # Field Validation is handled by the AgentCard dataclass.
         self.card = AgentCard.from_json(card) if isinstance(card, dict) else card
+        # Serialized card served on every card request, rebuilt after the card changes
+        self._card_bytes: bytes | None = None
+        # Ids of the skills on the card, kept in step with _add_skill_to_agent_card()
+        self._skill_ids: set[str] = {skill.id for skill in self.card.skills}
         self.context_manager = ContextManager()
         self.llm = llm
         self.tools: dict[str, BaseTool] = {}
+        # (tool name, arguments) -> result of a cacheable tool
+        self._tool_cache: dict[tuple[str, tuple], Any] = {}
         self.skills: Literal["auto", "fixed"] = skills
 
         # Initilize Registry Client
@@ -74,9 +113,11 @@ class Agent:
         # Initialize client and server components
         if transport is None:
             self._client, self._server = None, None
-            logger.warning(
-                "No transport provided, agent will not be able to receive tasks. Call set_transport() to configure."
-            )
+            if type(self) not in _warned_no_transport:
+                _warned_no_transport.add(type(self))
+                logger.warning(
+                    "No transport provided, agent will not be able to receive tasks. Call set_transport() to configure."
+                )
         else:
             self._client = AgentClient(transport=transport)
             # Exposes AgentProtocol to Server
@@ -88,8 +129,7 @@ class Agent:
 
         # LLM Validation
         if self.llm is not None:
-            if self.llm.validate_connection():
-                self.card.capabilities.has_llm = True  # Override even if defined by the user.
+            self._on_llm_validated(connected=self.llm.validate_connection())
 
         # Resolve and add necessairy skills
         self._resolve_skills(skills)
@@ -97,6 +137,30 @@ class Agent:
         # Uptime
         self.start_time: float | None = None
 
+    @classmethod
+    async def create(cls: type[AgentT], *args: Any, llm: LLM | None = None, **kwargs: Any) -> AgentT:
+        """Build an agent without blocking the event loop on the LLM connection check.
+
+        Takes the same arguments as the constructor, except that ``llm`` must be passed by keyword. The LLM is
+        attached after construction and its ``validate_connection()`` probe runs in a worker thread, so several agents
+        can be created concurrently with ``asyncio.gather`` and their probes overlap instead of running one after the
+        other. The constructor therefore sees ``self.llm`` as None. The agent URL is still validated in the constructor;
+        that check only parses the URL locally, so there is nothing to overlap it with.
+
+        Returns:
+            The initialized agent
+
+        Raises:
+            TypeError: If an LLM is passed positionally
+        """
+        if any(isinstance(arg, LLM) for arg in args):
+            raise TypeError("Agent.create() takes the llm as a keyword argument")
+        agent = cls(*args, **kwargs)
+        if llm is not None:
+            agent.llm = llm
+            agent._on_llm_validated(connected=await asyncio.to_thread(llm.validate_connection))
+        return agent
+
     # ----------------------------------------------------------------------
     # Agent Server Lifecycle - A2A Operations
     # ----------------------------------------------------------------------
@@ -190,18 +254,16 @@ class Agent:
             Default implementation calls handle_task and emits completion event.
             Override this method to provide streaming updates.
         """
-        from protolink.core.events import TaskStatusUpdateEvent
-
-        # Default: emit working status, call sync handler, emit complete
+        # Default: emit working status, call the task handler, emit complete
         yield TaskStatusUpdateEvent(task_id=task.id, previous_state="submitted", new_state="working")
 
         try:
             result_task = self.handle_task(task)
+            if inspect.isawaitable(result_task):
+                result_task = await result_task
 
             # Emit artifacts if any (NEW in v0.2.0)
             for artifact in result_task.artifacts:
-                from protolink.core.events import TaskArtifactUpdateEvent
-
                 yield TaskArtifactUpdateEvent(task_id=task.id, artifact=artifact)
 
             # Emit completion
@@ -209,8 +271,6 @@ class Agent:
                 task_id=result_task.id, previous_state="working", new_state="completed", final=True
             )
         except Exception as e:
-            from protolink.core.events import TaskErrorEvent
-
             yield TaskErrorEvent(task_id=task.id, error_code="task_failed", error_message=str(e), recoverable=False)
 
     def process(self, message_text: str) -> str:
@@ -258,6 +318,26 @@ class Agent:
 
         return await self._client.send_task(agent_url, task)
 
+    async def send_tasks_to(
+        self, calls: Iterable[tuple[str, Task]], *, max_concurrency: int = SEND_TASKS_MAX_CONCURRENCY
+    ) -> list[Task | BaseException]:
+        """Send tasks to several agents concurrently.
+
+        Args:
+            calls: (agent URL, task) pairs to send
+            max_concurrency: Maximum number of tasks in flight at the same time
+
+        Returns:
+            The result of each call in order: the returned Task, or the exception the call raised
+
+        Raises:
+            RuntimeError: If no transport is configured
+        """
+        if not self._client:
+            raise RuntimeError("No transport client configured. Call set_transport() first.")
+
+        return await self._client.send_tasks(calls, max_concurrency=max_concurrency)
+
     async def send_message_to(self, agent_url: str, message: Message) -> Message:
         """Send a message to another agent.
 
@@ -295,6 +375,9 @@ class Agent:
     def discover_agents(self, filter_by: dict[str, Any] | None = None) -> list[AgentCard]:
         """Discover agents in the registry.
 
+        The Registry is queried on every call. To reuse results for a while, pass a ``RegistryClient`` created with
+        a ``cache_ttl`` as the agent's registry.
+
         Args:
             filter_by: Optional filter criteria (e.g., {"capabilities.streaming": True})
 
@@ -322,6 +405,9 @@ class Agent:
     def add_tool(self, tool: BaseTool) -> None:
         """Register a Tool instance with the agent."""
         self.tools[tool.name] = tool
+        # Results of a replaced tool of the same name must not be served anymore
+        for key in [key for key in self._tool_cache if key[0] == tool.name]:
+            del self._tool_cache[key]
         skill = AgentSkill(id=tool.name, description=tool.description or f"Tool: {tool.name}", tags=tool.tags)
         self._add_skill_to_agent_card(skill)
 
@@ -332,8 +418,13 @@ class Agent:
         input_schema: dict[str, Any] | None = None,
         output_schema: dict[str, Any] | None = None,
         tags: list[str] | None = None,
+        *,
+        cacheable: bool = False,
     ):
-        """Decorator helper for defining inline tool functions."""
+        """Decorator helper for defining inline tool functions.
+
+        Set ``cacheable`` for deterministic tools so repeated calls with the same arguments reuse the first result.
+        """
 
         # decorator for Native functions
         def decorator(func):
@@ -345,6 +436,7 @@ class Agent:
                     output_schema=output_schema,
                     tags=tags,
                     func=func,
+                    cacheable=cacheable,
                 )
             )
             return func
@@ -352,11 +444,32 @@ class Agent:
         return decorator
 
     async def call_tool(self, tool_name: str, **kwargs):
-        """Invoke a registered tool by name with provided kwargs."""
+        """Invoke a registered tool by name with provided kwargs.
+
+        Results of tools marked ``cacheable`` are memoized per argument set, so the same result object is returned
+        for repeated calls. Callers must not mutate a cached result, since later callers receive the same object.
+        """
         tool = self.tools.get(tool_name, None)
         if not tool:
             raise ValueError(f"Tool {tool_name} not found")
-        return await tool(**kwargs)
+        if not getattr(tool, "cacheable", False):
+            return await tool(**kwargs)
+
+        # Value types are part of the key, since e.g. 1, 1.0 and True compare (and hash) equal
+        key = (tool_name, tuple(sorted((name, type(value), value) for name, value in kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments cannot be used as a cache key
+            return await tool(**kwargs)
+        if key in self._tool_cache:
+            return self._tool_cache[key]
+
+        result = await tool(**kwargs)
+        if len(self._tool_cache) >= TOOL_CACHE_MAX_SIZE:
+            del self._tool_cache[next(iter(self._tool_cache))]
+        self._tool_cache[key] = result
+        return result
 
     # ----------------------------------------------------------------------
     # Skill Management
@@ -381,10 +494,10 @@ class Agent:
         Args:
             skill: AgentSkill to add to the card
         """
-        # Check if skill with same ID already exists
-        existing_ids = {existing_skill.id for existing_skill in self.card.skills}
-        if skill.id not in existing_ids:
+        if skill.id not in self._skill_ids:
+            self._skill_ids.add(skill.id)
             self.card.skills.append(skill)
+            self.clear_card_cache()
 
     def _auto_detect_skills(self, *, include_public_methods: bool = False) -> list[AgentSkill]:
         """Automatically detect skills from available tools and methods.
@@ -430,6 +543,23 @@ class Agent:
         """
         return self.card.to_json() if as_json else self.card
 
+    def get_agent_card_bytes(self) -> bytes:
+        """Return the agent card encoded as a UTF-8 JSON document, ready to be sent over the wire.
+
+        The encoding is computed once and reused until the card cache is cleared. Skills added through the agent
+        clear it automatically; call ``clear_card_cache()`` after modifying ``self.card`` directly.
+
+        Returns:
+            The JSON-encoded agent card
+        """
+        if self._card_bytes is None:
+            self._card_bytes = fastjson.dumps_bytes(self.get_agent_card())
+        return self._card_bytes
+
+    def clear_card_cache(self) -> None:
+        """Drop the cached encoding of the agent card so it is rebuilt on the next request."""
+        self._card_bytes = None
+
     def get_agent_status_html(self) -> str:
         """Return the agent's status as HTML.
 
@@ -461,5 +591,11 @@ class Agent:
     # Private Methods
     # ----------------------------------------------------------------------
 
+    def _on_llm_validated(self, *, connected: bool) -> None:
+        """Advertise the LLM capability once the connection check has passed."""
+        if connected:
+            self.card.capabilities.has_llm = True  # Override even if defined by the user.
+            self.clear_card_cache()
+
     def __repr__(self) -> str:
         return f"Agent(name='{self.card.name}', url='{self.card.url}')"
@@ -1,16 +1,48 @@
+import asyncio
+from collections.abc import Awaitable, Iterable
+
 from protolink.models import Message, Task
 from protolink.transport import AgentTransport
 
+# Default cap on requests in flight for a single send_tasks() fan-out
+SEND_TASKS_MAX_CONCURRENCY = 64
+
 
 class AgentClient:
+    __slots__ = ("transport",)
+
     def __init__(self, transport: AgentTransport):
         self.transport = transport
 
     # ----------------------------------------------------------------------
     # Agent-to-Agent Communication
     # ----------------------------------------------------------------------
-    async def send_task(self, agent_url: str, task: Task) -> Task:
-        return await self.transport.send_task(agent_url, task)
+    # Plain functions returning the transport's coroutine: callers await it directly, without an extra wrapper frame
+    def send_task(self, agent_url: str, task: Task) -> Awaitable[Task]:
+        return self.transport.send_task(agent_url, task)
+
+    def send_message(self, agent_url: str, message: Message) -> Awaitable[Message]:
+        return self.transport.send_message(agent_url, message)
+
+    async def send_tasks(
+        self, calls: Iterable[tuple[str, Task]], *, max_concurrency: int = SEND_TASKS_MAX_CONCURRENCY
+    ) -> list[Task | BaseException]:
+        """Send several tasks concurrently, e.g. when an orchestrator fans out to its sub-agents.
+
+        At most ``max_concurrency`` tasks are in flight at once, so a large fan-out cannot exhaust the transport's
+        connections.
+
+        Args:
+            calls: (agent URL, task) pairs to send
+            max_concurrency: Maximum number of tasks in flight at the same time
+
+        Returns:
+            The result of each call in order: the returned Task, or the exception the call raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(agent_url: str, task: Task) -> Task:
+            async with semaphore:
+                return await self.transport.send_task(agent_url, task)
 
-    async def send_message(self, agent_url: str, message: Message) -> Message:
-        return await self.transport.send_message(agent_url, message)
+        return await asyncio.gather(*(send(agent_url, task) for agent_url, task in calls), return_exceptions=True)
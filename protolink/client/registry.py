@@ -1,3 +1,5 @@
+import asyncio
+import time
 from typing import Any
 
 from protolink.models import AgentCard
@@ -9,14 +11,78 @@ from protolink.transport import RegistryTransport
 
 
 class RegistryClient:
-    def __init__(self, transport: RegistryTransport):
+    def __init__(self, transport: RegistryTransport, cache_ttl: float = 0.0):
+        """Initialize the registry client.
+
+        Args:
+            transport: RegistryTransport used to reach the Registry
+            cache_ttl: Seconds a discovery result is reused before the Registry is queried again. Cached results may
+                miss agents registered (or still list agents unregistered) by other clients within that window.
+                Defaults to 0, which disables caching; concurrent identical lookups are still coalesced.
+        """
         self.transport = transport
+        self.cache_ttl = cache_ttl
+        # filter key -> (fetched_at, cards)
+        self._discover_cache: dict[str, tuple[float, list[AgentCard]]] = {}
+        # filter key -> in-flight discovery request shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future[list[AgentCard]]] = {}
+        # Bumped on every invalidation so results fetched before it are not cached
+        self._generation = 0
 
     async def register(self, card: AgentCard) -> None:
         await self.transport.register(card)
+        self.clear_cache()
+
+    async def register_many(self, cards: list[AgentCard]) -> None:
+        """Register several agents at once, in a single request where the transport supports it."""
+        await self.transport.register_many(cards)
+        self.clear_cache()
 
     async def unregister(self, agent_url: str) -> None:
         await self.transport.unregister(agent_url)
+        self.clear_cache()
 
     async def discover(self, filter_by: dict[str, Any] | None = None) -> list[AgentCard]:
-        return await self.transport.discover(filter_by)
+        key = self._cache_key(filter_by)
+        cached = self._discover_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
+        # Concurrent lookups for the same filter are coalesced into a single registry request.
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch(key, filter_by))
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return list(await asyncio.shield(request))
+
+    async def find_by_capability(self, capability: str) -> list[AgentCard]:
+        """Discover the agents that advertise ``capability`` (e.g. ``"streaming"``).
+
+        The filter is evaluated by the Registry, so only matching cards are transferred. Repeated lookups are served
+        from the discovery cache only when the client was created with a positive ``cache_ttl``.
+        """
+        return await self.discover({f"capabilities.{capability}": True})
+
+    def clear_cache(self) -> None:
+        """Drop all cached discovery results."""
+        self._discover_cache.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    async def _fetch(self, key: str, filter_by: dict[str, Any] | None) -> list[AgentCard]:
+        generation = self._generation
+        # Failed lookups raise before anything is stored, so errors are never cached.
+        cards = await self.transport.discover(filter_by)
+        if self.cache_ttl > 0 and generation == self._generation:
+            self._discover_cache[key] = (time.monotonic(), list(cards))
+        return cards
+
+    def _forget_inflight(self, key: str, request: asyncio.Future[list[AgentCard]]) -> None:
+        # A newer request may have replaced this one after an invalidation.
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+
+    @staticmethod
+    def _cache_key(filter_by: dict[str, Any] | None) -> str:
+        return repr(sorted(filter_by.items())) if filter_by else ""
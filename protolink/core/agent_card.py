@@ -3,12 +3,13 @@ from typing import Any, TypedDict
 
 from protolink import __version__ as protolink_version
 from protolink.types import AgentRoleType, MimeType, SecuritySchemeType, TransportType
+from protolink.utils import fastjson
 from protolink.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapabilities:
     """Defines the capabilities and limitations of an agent.
 
@@ -55,7 +56,7 @@ class AgentCapabilities:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSkill:
     """Represents a task that an agent can perform.
 
@@ -79,7 +80,7 @@ class AgentSkill:
             self.examples = []
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCard:
     """Agent identity and capability declaration.
 
@@ -130,6 +131,10 @@ class AgentCard:
             "tags": self.tags,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Convert to a UTF-8 encoded JSON document, ready to be sent over the wire."""
+        return fastjson.dumps_bytes(self.to_json())
+
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> "AgentCard":
         """Create from JSON format."""
@@ -1,7 +1,7 @@
 import uuid
-from datetime import datetime, timezone
 
 from protolink.core.context import Context
+from protolink.utils.timestamps import utc_now_iso
 
 
 class ContextManager:
@@ -51,7 +51,7 @@ class ContextManager:
         """
         context = self.contexts.get(context_id)
         if context:
-            context.last_accessed = datetime.now(timezone.utc).isoformat()
+            context.last_accessed = utc_now_iso()
         return context
 
     def add_message_to_context(self, context_id: str, message) -> bool:
@@ -5,7 +5,7 @@ from typing import Any, Literal
 from protolink.types import HttpMethod, RequestSourceType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndpointSpec:
     name: str
     path: str
@@ -56,9 +56,9 @@ class Message:
     @classmethod
     def user(cls, text: str) -> "Message":
         """Create a user message with text (convenience method)."""
-        return cls(role="user").add_text(text)
+        return cls(role="user", parts=[Part(type="text", content=text)])
 
     @classmethod
     def agent(cls, text: str) -> "Message":
         """Create an agent message with text (convenience method)."""
-        return cls(role="agent").add_text(text)
+        return cls(role="agent", parts=[Part(type="text", content=text)])
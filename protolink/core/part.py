@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
 
@@ -16,7 +16,7 @@ class Part:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {"type": self.type, "content": self.content}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Part":
@@ -1,14 +1,23 @@
 # protolink/registry/registry.py
+import asyncio
 import time
+from dataclasses import fields
 from typing import Any
 
 from protolink.client import RegistryClient
+from protolink.core.agent_card import AgentCapabilities
 from protolink.models import AgentCard
 from protolink.server import RegistryServer
 from protolink.transport import HTTPRegistryTransport, RegistryTransport
 from protolink.utils.logging import get_logger
 from protolink.utils.renderers import to_registry_status_html
 
+# Sentinel for card attributes that do not exist, so a filter on a missing field never matches
+_MISSING = object()
+
+# Boolean capability flags, indexed by the registry so capability lookups do not scan every card
+_CAPABILITY_FLAGS = frozenset(f.name for f in fields(AgentCapabilities) if f.type in (bool, "bool"))
+
 
 class Registry:
     """Centralized Registry with server and client components.
@@ -39,6 +48,10 @@ class Registry:
 
         # Local store for agent cards
         self._agents: dict[str, AgentCard] = {}
+        # Capability flag -> {agent url: card} of the agents advertising it
+        self._by_capability: dict[str, dict[str, AgentCard]] = {}
+        # Notified on every registration, see wait_for_agents()
+        self._registered = asyncio.Condition()
 
         self.start_time: float | None = None
 
@@ -74,6 +87,9 @@ class Registry:
     async def register(self, card: AgentCard) -> None:
         await self._client.register(card)
 
+    async def register_many(self, cards: list[AgentCard]) -> None:
+        await self._client.register_many(cards)
+
     async def unregister(self, agent_url: str) -> None:
         await self._client.unregister(agent_url)
 
@@ -85,7 +101,9 @@ class Registry:
     # ------------------------------------------------------------------
 
     async def handle_register(self, card: AgentCard) -> None:
-        self._agents[card.url] = card
+        self._store(card)
+        async with self._registered:
+            self._registered.notify_all()
 
         self.logger.info(
             "Agent Card Registered:",
@@ -95,8 +113,28 @@ class Registry:
             },
         )
 
+    async def handle_register_many(self, cards: list[AgentCard]) -> None:
+        """Register several agent cards at once, e.g. when seeding the registry with a fleet on startup.
+
+        Waiters are notified once for the whole batch.
+
+        Args:
+            cards: Agent cards to register. A later card replaces an earlier one with the same URL.
+        """
+        for card in cards:
+            self._store(card)
+        async with self._registered:
+            self._registered.notify_all()
+
+        self.logger.info(
+            f"{len(cards)} Agent Cards Registered",
+            extra={"agent_urls": [card.url for card in cards]},
+        )
+
     async def handle_unregister(self, agent_url: str) -> None:
-        self._agents.pop(agent_url, None)
+        card = self._agents.pop(agent_url, None)
+        if card is not None:
+            self._unindex(card)
 
     async def handle_discover(
         self, filter_by: dict[str, Any] | None = None, *, as_json: bool = True
@@ -105,8 +143,30 @@ class Registry:
         if not filter_by:
             return list(self._agents.values())
 
+        indexed = self._indexed_capability(filter_by)
+        if indexed is not None:
+            # The index narrows the candidates; each is re-checked in case its card was edited after registration.
+            # Flags enabled on a registered card in place are indexed when the card is registered again.
+            cards = [c for c in self._by_capability.get(indexed, {}).values() if self._match(filter_by, c)]
+            return [c.to_json() for c in cards] if as_json else cards
+
         return [c.to_json() if as_json else c for c in self._agents.values() if self._match(filter_by, c)]
 
+    async def wait_for_agents(self, count: int, timeout: float | None = None) -> None:
+        """Wait until at least ``count`` agents are registered.
+
+        Waiters are woken by each registration instead of polling the registry.
+
+        Args:
+            count: Number of registered agents to wait for
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely
+
+        Raises:
+            asyncio.TimeoutError: If fewer than ``count`` agents registered within ``timeout``
+        """
+        async with self._registered:
+            await asyncio.wait_for(self._registered.wait_for(lambda: len(self._agents) >= count), timeout)
+
     def handle_status_html(self) -> str:
         """Return the registry's status as HTML.
 
@@ -119,8 +179,52 @@ class Registry:
     # Utilities
     # ------------------------------------------------------------------
 
+    def _store(self, card: AgentCard) -> None:
+        previous = self._agents.get(card.url)
+        if previous is not None:
+            self._unindex(previous)
+        self._agents[card.url] = card
+        for flag in _CAPABILITY_FLAGS:
+            if getattr(card.capabilities, flag) is True:
+                self._by_capability.setdefault(flag, {})[card.url] = card
+
+    def _unindex(self, card: AgentCard) -> None:
+        for agents in self._by_capability.values():
+            agents.pop(card.url, None)
+
+    @staticmethod
+    def _indexed_capability(filter_by: dict[str, Any]) -> str | None:
+        """Return the capability flag when ``filter_by`` is a single ``{"capabilities.<flag>": True}`` criterion."""
+        if len(filter_by) != 1:
+            return None
+        ((key, expected),) = filter_by.items()
+        prefix, _, flag = key.partition(".")
+        if prefix != "capabilities" or flag not in _CAPABILITY_FLAGS:
+            return None
+        return flag if expected is True or expected == "true" else None
+
     def _match(self, filter_by: dict[str, Any], card: AgentCard) -> bool:
-        return all(getattr(card, k, None) == v for k, v in filter_by.items())
+        """Check whether ``card`` satisfies every ``filter_by`` criterion.
+
+        Keys may be dotted paths into nested fields (e.g. ``"capabilities.streaming"``). Filters that arrive as query
+        parameters are strings, so a string criterion also matches the query-string form of the value.
+        """
+        for key, expected in filter_by.items():
+            value: Any = card
+            for attr in key.split("."):
+                value = getattr(value, attr, _MISSING)
+            if value is _MISSING:
+                return False
+            if value != expected and not (isinstance(expected, str) and self._as_query_value(value) == expected):
+                return False
+        return True
+
+    @staticmethod
+    def _as_query_value(value: Any) -> str:
+        # Mirrors how httpx encodes query parameters
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
 
     def list_urls(self) -> list[str]:
         return list(self._agents.keys())
@@ -130,6 +234,7 @@ class Registry:
 
     def clear(self) -> None:
         self._agents.clear()
+        self._by_capability.clear()
 
     def __repr__(self) -> str:
         return f"Registry(agents={self.count()})"
@@ -4,14 +4,27 @@ ProtoLink - Security & Authentication
 OAuth 2.0, Bearer tokens authorization for enterprise deployments.
 """
 
+import hashlib
 import json
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 from protolink.types import HttpAuthScheme, SecuritySchemeType
 
+# Upper bound on verified bearer tokens remembered by BearerTokenAuth; the least recently used is evicted first
+TOKEN_CACHE_MAX_SIZE = 1024
+
+
+def _digest(secret: str) -> bytes:
+    """Hash a credential for use as a lookup key, so lookups never compare plaintext credentials."""
+    return hashlib.blake2b(secret.encode(), digest_size=16).digest()
+
 
 @dataclass
 class SecurityContext:
@@ -25,6 +38,7 @@ class SecurityContext:
         expires_at: When token expires (ISO format)
         issued_at: When token was issued (ISO format)
         metadata: Additional auth metadata
+        scopes: Scopes granted to the principal
     """
 
     principal_id: str
@@ -32,6 +46,18 @@ class SecurityContext:
     expires_at: str | None = None
     issued_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     metadata: dict[str, Any] = field(default_factory=dict)
+    scopes: frozenset[str] = frozenset()
+
+    def has_scope(self, scope: str) -> bool:
+        """Check if the principal was granted a scope.
+
+        Args:
+            scope: Scope to check (e.g. "skill:analyze")
+
+        Returns:
+            True if the scope was granted
+        """
+        return scope in self.scopes
 
     def is_expired(self) -> bool:
         """Check if token is expired.
@@ -42,6 +68,10 @@ class SecurityContext:
         if not self.expires_at:
             return False
 
+        # JWT "exp" claims are Unix timestamps rather than ISO strings
+        if isinstance(self.expires_at, int | float):
+            return time.time() > self.expires_at
+
         expires = datetime.fromisoformat(self.expires_at)
         return datetime.utcnow() > expires
 
@@ -53,6 +83,7 @@ class SecurityContext:
             "expires_at": self.expires_at,
             "issued_at": self.issued_at,
             "metadata": self.metadata,
+            "scopes": sorted(self.scopes),
         }
 
 
@@ -148,16 +179,36 @@ class BearerTokenAuth(Authenticator):
         """
         self.secret = secret
         self.algorithm = algorithm
+        # Digest of a verified token -> its context, in least to most recently used order
+        self._verified: OrderedDict[bytes, SecurityContext] = OrderedDict()
 
     async def authenticate(self, credentials: str) -> SecurityContext:
         """Authenticate bearer token.
 
+        A token that was verified before and has not expired yet is served from a cache, so repeated requests
+        with the same token are not decoded again. The cached context is shared between those requests.
+
         Args:
             credentials: Bearer token string
 
         Returns:
             AuthContext extracted from token
         """
+        key = _digest(credentials)
+        context = self._verified.get(key)
+        if context is not None:
+            if not context.is_expired():
+                self._verified.move_to_end(key)
+                return context
+            del self._verified[key]
+
+        context = self._decode(credentials)
+        self._verified[key] = context
+        if len(self._verified) > TOKEN_CACHE_MAX_SIZE:
+            self._verified.popitem(last=False)
+        return context
+
+    def _decode(self, credentials: str) -> SecurityContext:
         try:
             # TODO(): Implement proper JWT validation
             # For demo: parse JWT format (in production, use PyJWT)
@@ -290,7 +341,18 @@ class APIKeyAuth(Authenticator):
             valid_keys: Dict mapping keys to scope lists
                        e.g., {"key-123": ["abc..."]}
         """
-        self.valid_keys = valid_keys
+        self._valid_keys = MappingProxyType({key: list(scopes) for key, scopes in valid_keys.items()})
+        # Keys are looked up by digest, so comparing them leaks nothing about the plaintext keys through timing.
+        # Scopes are frozen once here so scope checks are constant-time lookups.
+        self._keys = {_digest(key): frozenset(scopes) for key, scopes in valid_keys.items()}
+
+    @property
+    def valid_keys(self) -> Mapping[str, list[str]]:
+        """Read-only view of the configured keys and their scopes.
+
+        Keys are fixed at construction; create a new ``APIKeyAuth`` to change them.
+        """
+        return self._valid_keys
 
     async def authenticate(self, credentials: str) -> SecurityContext:
         """Validate API key.
@@ -301,10 +363,11 @@ class APIKeyAuth(Authenticator):
         Returns:
             AuthContext if key is valid
         """
-        if credentials not in self.valid_keys:
+        scopes = self._keys.get(_digest(credentials))
+        if scopes is None:
             raise Exception("Invalid API key")
 
-        return SecurityContext(principal_id=f"api-key-{credentials[:8]}", token=credentials)
+        return SecurityContext(principal_id=f"api-key-{credentials[:8]}", token=credentials, scopes=scopes)
 
     async def refresh_token(self, context: SecurityContext) -> SecurityContext:
         """API keys don't refresh.
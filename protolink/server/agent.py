@@ -13,6 +13,7 @@ It does **not** implement networking itself. Instead, it:
 
 from __future__ import annotations
 
+import inspect
 from typing import Any, Protocol
 
 from protolink.models import AgentCard, EndpointSpec, Task
@@ -33,6 +34,9 @@ class AgentInterface(Protocol):
     async def get_agent_card(self, *, as_json: bool = True) -> AgentCard | dict[str, Any]:
         """Return the agent's public metadata and capabilities."""
 
+    def get_agent_card_bytes(self) -> bytes:
+        """Return the agent card as an encoded JSON document."""
+
     async def get_agent_status_html(self) -> str:
         """Return a human-readable HTML status page."""
 
@@ -63,6 +67,18 @@ class AgentServer:
     async def task_parser(self, request: Any) -> Task:
         return Task.from_dict(request)
 
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    async def task_handler(self, task: Task) -> dict[str, Any]:
+        """Run the agent on ``task`` and return the result in wire format."""
+        result = self._agent.handle_task(task)
+        # Agents may implement handle_task synchronously
+        if inspect.isawaitable(result):
+            result = await result
+        return result.to_dict()
+
     # ------------------------------------------------------------------
     # Endpoints
     # ------------------------------------------------------------------
@@ -80,7 +96,7 @@ class AgentServer:
                     name="task",
                     path="/tasks/",
                     method="POST",
-                    handler=self._agent.handle_task,
+                    handler=self.task_handler,
                     request_source="body",
                     request_parser=self.task_parser,
                 ),
@@ -88,7 +104,7 @@ class AgentServer:
                     name="agent_card",
                     path="/.well-known/agent.json",
                     method="GET",
-                    handler=self._agent.get_agent_card,
+                    handler=self._agent.get_agent_card_bytes,
                     request_source="none",
                 ),
                 EndpointSpec(
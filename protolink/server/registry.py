@@ -18,6 +18,9 @@ class RegistryInterface(Protocol):
     async def handle_register(self, card: AgentCard) -> dict[str, str]:
         """Handle an incoming register request by an Agent."""
 
+    async def handle_register_many(self, cards: list[AgentCard]) -> None:
+        """Handle an incoming bulk register request."""
+
     async def handle_unregister(self, agent_url: str) -> dict[str, str]:
         """Handle an incoming unregister request by an Agent."""
 
@@ -46,11 +49,24 @@ class RegistryServer:
     async def register_parser(self, request: Any) -> AgentCard:
         return AgentCard.from_json(request)
 
+    async def register_many_parser(self, request: Any) -> list[AgentCard]:
+        return [AgentCard.from_json(card) for card in request]
+
     async def unregister_parser(self, request: Any) -> str:
         return request.get("agent_url")
 
     async def discover_parser(self, request: Any) -> dict[str, Any] | None:
-        return request.get("filter_by")
+        # Filter criteria are sent as the query parameters themselves
+        return dict(request) or None
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    async def discover_handler(self, filter_by: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Run discovery on the registry and return the cards in wire format."""
+        cards = await self._registry.handle_discover(filter_by)
+        return [c.to_json() if isinstance(c, AgentCard) else c for c in cards]
 
     # ------------------------------------------------------------------
     # Endpoints
@@ -73,6 +89,14 @@ class RegistryServer:
                     request_source="body",
                     request_parser=self.register_parser,
                 ),
+                EndpointSpec(
+                    name="register_many",
+                    path="/agents/batch/",
+                    method="POST",
+                    handler=self._registry.handle_register_many,
+                    request_source="body",
+                    request_parser=self.register_many_parser,
+                ),
                 EndpointSpec(
                     name="unregister",
                     path="/agents/",
@@ -85,7 +109,7 @@ class RegistryServer:
                     name="discover",
                     path="/agents/",
                     method="GET",
-                    handler=self._registry.handle_discover,
+                    handler=self.discover_handler,
                     request_source="query_params",
                     request_parser=self.discover_parser,
                 ),
@@ -17,6 +17,8 @@ class Tool(BaseTool):
 
     func: Callable[..., Any]
     args: dict[str, Any] | None = None
+    # Deterministic tools can have their results memoized by the Agent per argument set
+    cacheable: bool = False
 
     async def __call__(self, **kwargs):
         # call the underlying function
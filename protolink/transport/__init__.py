@@ -1,11 +1,15 @@
+from typing import TYPE_CHECKING
+
 from .agent.base import AgentTransport
 from .agent.http_transport import HTTPAgentTransport
 from .agent.runtime_transport import RuntimeAgentTransport
-from .agent.websocket_transport import WebSocketAgentTransport
 from .factory import get_agent_transport
 from .registry.base import RegistryTransport
 from .registry.http_transport import HTTPRegistryTransport
 
+if TYPE_CHECKING:
+    from .agent.websocket_transport import WebSocketAgentTransport
+
 __all__ = [
     "AgentTransport",  # base model
     "HTTPAgentTransport",
@@ -15,3 +19,13 @@ __all__ = [
     "WebSocketAgentTransport",
     "get_agent_transport",
 ]
+
+
+def __getattr__(name: str):
+    # The WebSocket transport pulls in the websockets package, so it is only imported when first used
+    if name == "WebSocketAgentTransport":
+        from .agent.websocket_transport import WebSocketAgentTransport
+
+        globals()[name] = WebSocketAgentTransport
+        return WebSocketAgentTransport
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
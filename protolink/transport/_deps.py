@@ -15,14 +15,14 @@ def _require_fastapi(*, validate_schema: bool = False):
     """
     try:
         from fastapi import FastAPI, Request
-        from fastapi.responses import HTMLResponse, JSONResponse
+        from fastapi.responses import HTMLResponse, Response
         from pydantic import BaseModel
     except ImportError as exc:
         raise ImportError(
             "FastAPI backend requires the 'fastapi' extra. Install it with: pip install protolink[fastapi]"
         ) from exc
 
-    return FastAPI, Request, JSONResponse, HTMLResponse, BaseModel
+    return FastAPI, Request, Response, HTMLResponse, BaseModel
 
 
 def _require_starlette():
@@ -36,10 +36,10 @@ def _require_starlette():
     try:
         from starlette.applications import Starlette
         from starlette.requests import Request
-        from starlette.responses import HTMLResponse, JSONResponse
+        from starlette.responses import HTMLResponse, Response
     except ImportError as exc:
         raise ImportError(
             "Starlette backend requires the 'starlette' extra. Install it with: pip install protolink[starlette]"
         ) from exc
 
-    return Starlette, Request, JSONResponse, HTMLResponse
+    return Starlette, Request, Response, HTMLResponse
@@ -5,7 +5,9 @@ This module exposes :class:`HTTPAgentTransport`, which sends and receives
 or FastAPI backend for the server side.
 """
 
-from typing import ClassVar
+import asyncio
+from collections.abc import Iterable
+from typing import Any, ClassVar
 from urllib.parse import urlparse
 
 import httpx
@@ -15,6 +17,11 @@ from protolink.security.auth import Authenticator
 from protolink.transport.agent.base import AgentTransport
 from protolink.transport.backends import BackendInterface, FastAPIBackend, StarletteBackend
 from protolink.types import BackendType, TransportType
+from protolink.utils import fastjson
+
+# Connection pool shared by every outbound request of a transport instance. Keep-alive connections avoid paying
+# a TCP (and TLS) handshake per task sent to the same agent.
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=32, keepalive_expiry=30.0)
 
 
 class HTTPAgentTransport(AgentTransport):
@@ -37,6 +44,11 @@ class HTTPAgentTransport(AgentTransport):
     validate_schema:
         When using the FastAPI backend, controls whether incoming
         requests are validated with Pydantic models.
+    client:
+        Optional :class:`httpx.AsyncClient` to send requests with, e.g. one
+        shared by several transports so they use a single connection pool.
+        The caller owns it: :meth:`close` and :meth:`stop` leave it open, and
+        its own timeout applies instead of ``timeout``.
     """
 
     def __init__(
@@ -47,6 +59,7 @@ class HTTPAgentTransport(AgentTransport):
         backend: BackendType = "starlette",
         *,
         validate_schema: bool = False,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.transport_type: ClassVar[TransportType] = "http"
         self.url = url
@@ -54,8 +67,12 @@ class HTTPAgentTransport(AgentTransport):
         self.timeout: float = timeout
         self.authenticator: Authenticator | None = authenticator
         self.security_context: object | None = None
+        # (bearer token, headers) of the last build; rebuilt only when the token changes
+        self._headers_cache: tuple[str | None, dict[str, str]] | None = None
         # Handlers that are called for different Server Requests
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        # Only a client created by the transport itself is closed by it
+        self._owns_client = client is None
 
         # Select backend implementation.
         if backend.lower() == "fastapi":
@@ -84,25 +101,9 @@ class HTTPAgentTransport(AgentTransport):
     async def send_task(self, agent_url: str, task: Task) -> Task:
         """Send a ``Task`` to a remote agent and return the resulting task."""
 
-        client = await self._ensure_client()
-        headers = self._build_headers()
-        url = f"{agent_url.rstrip('/')}/tasks/"
-
-        try:
-            response = await client.post(url, json=task.to_dict(), headers=headers)
-            response.raise_for_status()
-            return Task.from_dict(response.json())
-        except httpx.ConnectError as e:
-            raise ConnectionError(
-                f"Failed to connect to agent at {agent_url}. Make sure the agent is running and accessible."
-            ) from e
-        except httpx.RemoteProtocolError as e:
-            raise ConnectionError(
-                f"Protocol error when communicating with agent at {agent_url}. "
-                f"The target may not be a proper HTTP server or may be misconfigured."
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise RuntimeError(f"Agent at {agent_url} returned HTTP {e.response.status_code}: {e.response.text}") from e
+        body = fastjson.dumps_bytes(task.to_dict())
+        response = await self._request("POST", agent_url, "/tasks/", content=body, headers=self._build_headers())
+        return Task.from_dict(fastjson.loads(response.content))
 
     async def send_message(self, agent_url: str, message: Message) -> Message:
         """Convenience wrapper around :meth:`send_task` for a single message."""
@@ -120,24 +121,28 @@ class HTTPAgentTransport(AgentTransport):
     async def get_agent_card(self, agent_url: str) -> AgentCard:
         """Fetch the agent's :class:`AgentCard` description directly from the Agent."""
 
-        client = await self._ensure_client()
-        url = f"{agent_url.rstrip('/')}/.well-known/agent.json"
+        response = await self._request("GET", agent_url, "/.well-known/agent.json")
+        return AgentCard.from_json(fastjson.loads(response.content))
 
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            return AgentCard.from_json(response.json())
-        except httpx.ConnectError as e:
-            raise ConnectionError(
-                f"Failed to connect to agent at {agent_url}. Make sure the agent is running and accessible."
-            ) from e
-        except httpx.RemoteProtocolError as e:
-            raise ConnectionError(
-                f"Protocol error when communicating with agent at {agent_url}. "
-                f"The target may not be a proper HTTP server or may be misconfigured."
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise RuntimeError(f"Agent at {agent_url} returned HTTP {e.response.status_code}: {e.response.text}") from e
+    async def warmup(self, agent_urls: Iterable[str]) -> None:
+        """Open pooled connections to known agents ahead of the first task.
+
+        Each agent's card endpoint is requested concurrently, so DNS resolution
+        and the TCP (and TLS) handshake happen now instead of on the critical
+        path of the first :meth:`send_task`. Unreachable agents are ignored.
+
+        Parameters
+        ----------
+        agent_urls:
+            Base URLs of the agents this transport is going to talk to.
+        """
+
+        client = await self._ensure_client()
+        base_urls = {url.rstrip("/") for url in agent_urls}
+        await asyncio.gather(
+            *(client.get(f"{url}/.well-known/agent.json") for url in base_urls),
+            return_exceptions=True,
+        )
 
     async def subscribe_task(self, agent_url: str, task: Task) -> None:
         """Subscribe to a long-running task (not yet implemented)."""
@@ -159,24 +164,78 @@ class HTTPAgentTransport(AgentTransport):
         # Start the HTTP server
         await self.backend.start(self.host, self.port)
 
-        # Initialize HTTP client
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        # Initialize HTTP client, reusing the pool if a request was already sent before start()
+        await self._ensure_client()
 
     async def stop(self) -> None:
         """Stop the HTTP server and close the underlying HTTP client."""
 
         await self.backend.stop()
-        if self._client:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client without touching the server side.
+
+        An externally provided client is left open for its owner to close.
+        """
+
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        """Return an initialized :class:`httpx.AsyncClient` instance."""
+        """Return the pooled :class:`httpx.AsyncClient` instance, creating it on first use."""
 
         if not self._client:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_POOL_LIMITS)
         return self._client
 
+    async def _request(self, method: str, agent_url: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to ``path`` on a remote agent.
+
+        Parameters
+        ----------
+        method:
+            HTTP method.
+        agent_url:
+            Base URL of the target agent.
+        path:
+            Endpoint path, starting with ``/``.
+        **kwargs:
+            Extra arguments forwarded to :meth:`httpx.AsyncClient.request`.
+
+        Returns
+        -------
+        httpx.Response
+            The successful HTTP response.
+
+        Raises
+        ------
+        ConnectionError
+            If the agent cannot be reached or does not speak HTTP.
+        RuntimeError
+            If the agent returns an error status.
+        """
+
+        client = await self._ensure_client()
+        url = f"{agent_url.rstrip('/')}{path}"
+
+        try:
+            response = await client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.ConnectError as e:
+            raise ConnectionError(
+                f"Failed to connect to agent at {agent_url}. Make sure the agent is running and accessible."
+            ) from e
+        except httpx.RemoteProtocolError as e:
+            raise ConnectionError(
+                f"Protocol error when communicating with agent at {agent_url}. "
+                f"The target may not be a proper HTTP server or may be misconfigured."
+            ) from e
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"Agent at {agent_url} returned HTTP {e.response.status_code}: {e.response.text}") from e
+
     # ------------------------------------------------------------------
     # Utility
     # ------------------------------------------------------------------
@@ -184,14 +243,23 @@ class HTTPAgentTransport(AgentTransport):
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers for an outgoing request.
 
-        Includes authentication headers when an auth context is present.
+        Declares a JSON body and includes authentication headers when an
+        auth context is present.
+        The result is cached until the token changes, so callers must not
+        mutate the returned mapping.
         """
 
-        headers: dict[str, str] = {}
+        token = self.security_context.token if self.authenticator and self.security_context else None
+        cached = self._headers_cache
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+        headers: dict[str, str] = {"Content-Type": "application/json"}
 
-        if self.authenticator and self.security_context:
-            headers["Authorization"] = f"Bearer {self.security_context.token}"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
 
+        self._headers_cache = (token, headers)
         return headers
 
     def validate_agent_url(self, agent_url: str) -> bool:
@@ -55,6 +55,12 @@ class JSONRPCTransport(AgentTransport):
             self._client = httpx.AsyncClient(timeout=self.timeout)
         return self._client
 
+    def _build_headers(self) -> dict[str, str]:
+        """Build HTTP headers for an outgoing request, including auth when authenticated."""
+        if self.security_context:
+            return {"Authorization": f"Bearer {self.security_context.token}"}
+        return {}
+
     def _next_request_id(self) -> int:
         """Generate next request ID."""
         self._request_id += 1
@@ -95,9 +101,7 @@ class JSONRPCTransport(AgentTransport):
             "id": self._next_request_id(),
         }
 
-        headers = {}
-        if self.security_context:
-            headers["Authorization"] = f"Bearer {self.security_context.token}"
+        headers = self._build_headers()
 
         response = await client.post(url, json=request, headers=headers)
         response.raise_for_status()
@@ -180,9 +184,7 @@ class JSONRPCTransport(AgentTransport):
             "id": self._next_request_id(),
         }
 
-        headers = {}
-        if self.security_context:
-            headers["Authorization"] = f"Bearer {self.security_context.token}"
+        headers = self._build_headers()
 
         try:
             async with client.stream("POST", agent_url, json=request, headers=headers) as response:
@@ -3,6 +3,7 @@ from collections.abc import Awaitable, Callable
 from typing import ClassVar, Protocol, runtime_checkable
 
 from protolink.core.agent_card import AgentCard
+from protolink.core.events import TaskStatusUpdateEvent
 from protolink.core.message import Message
 from protolink.core.task import Task
 from protolink.transport.agent.base import AgentTransport
@@ -104,7 +105,29 @@ class RuntimeAgentTransport(AgentTransport):
         if agent_url not in self.agents:
             raise ValueError(f"Agent not found: {agent_url}")
 
-        return self.agents[agent_url].get_agent_card()
+        return self.agents[agent_url].card
+
+    def get_agent_cards(self, agent_urls: list[str] | None = None) -> dict[str, AgentCard]:
+        """Get the cards of several local agents at once.
+
+        The cards are read straight from the registered agents, so no coroutine is scheduled per lookup.
+
+        Args:
+            agent_urls: Agent URLs or names. Defaults to every registered agent.
+
+        Returns:
+            Dict mapping each requested URL or name to its AgentCard
+
+        Raises:
+            ValueError: If an agent is not found
+        """
+        if agent_urls is None:
+            return {agent.card.url: agent.card for agent in self.agents.values()}
+
+        missing = [agent_url for agent_url in agent_urls if agent_url not in self.agents]
+        if missing:
+            raise ValueError(f"Agent not found: {', '.join(missing)}")
+        return {agent_url: self.agents[agent_url].card for agent_url in agent_urls}
 
     async def start(self) -> None:
         """No-op for in-memory transport."""
@@ -160,8 +183,6 @@ class RuntimeAgentTransport(AgentTransport):
             result_task = agent.handle_task(task)
             if inspect.isawaitable(result_task):
                 result_task = await result_task
-            from protolink.core.events import TaskStatusUpdateEvent
-
             yield TaskStatusUpdateEvent(task_id=result_task.id, new_state="completed", final=True).to_dict()
 
     async def _process_incoming_message(self, message: Message) -> Message | None:
@@ -1,4 +1,3 @@
-import json
 from collections.abc import Awaitable, Callable
 from typing import Any, ClassVar
 from urllib.parse import urlparse
@@ -14,6 +13,7 @@ from protolink.core.task import Task
 from protolink.security.auth import Authenticator
 from protolink.transport.agent.base import AgentTransport
 from protolink.types import TransportType
+from protolink.utils import fastjson
 
 
 class WebSocketAgentTransport(AgentTransport):
@@ -50,10 +50,10 @@ class WebSocketAgentTransport(AgentTransport):
 
         async with connect(ws_url, extra_headers=headers, open_timeout=self.timeout, close_timeout=self.timeout) as ws:
             payload = {"type": "task", "task": task.to_dict()}
-            await ws.send(json.dumps(payload))
+            await ws.send(fastjson.dumps(payload))
 
             async for raw in ws:
-                response = json.loads(raw)
+                response = fastjson.loads(raw)
                 if response.get("type") == "task_result":
                     return Task.from_dict(response["task"])
                 if response.get("type") == "error":
@@ -73,7 +73,7 @@ class WebSocketAgentTransport(AgentTransport):
         url = f"{http_url.rstrip('/')}/.well-known/agent.json"
         response = await client.get(url, timeout=self.timeout)
         response.raise_for_status()
-        return AgentCard.from_json(response.json())
+        return AgentCard.from_json(fastjson.loads(response.content))
 
     async def subscribe_task(self, agent_url: str, task: Task):
         raise NotImplementedError("WebSocket streaming is not implemented yet")
@@ -113,8 +113,8 @@ class WebSocketAgentTransport(AgentTransport):
         try:
             async for raw in websocket:
                 try:
-                    message = json.loads(raw)
-                except json.JSONDecodeError:
+                    message = fastjson.loads(raw)
+                except ValueError:
                     await self._send_error(websocket, "Invalid JSON payload")
                     continue
 
@@ -139,7 +139,7 @@ class WebSocketAgentTransport(AgentTransport):
 
         task = Task.from_dict(payload["task"])
         result = await self._task_handler(task)
-        await websocket.send(json.dumps({"type": "task_result", "task": result.to_dict()}))
+        await websocket.send(fastjson.dumps({"type": "task_result", "task": result.to_dict()}))
 
     async def _verify_request_auth(self, websocket: ServerConnection) -> None:
         if not self.authenticator:
@@ -194,4 +194,4 @@ class WebSocketAgentTransport(AgentTransport):
 
     @staticmethod
     async def _send_error(websocket, message: str) -> None:
-        await websocket.send(json.dumps({"type": "error", "message": message}))
+        await websocket.send(fastjson.dumps({"type": "error", "message": message}))
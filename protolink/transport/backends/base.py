@@ -1,6 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from protolink.models import EndpointSpec
+from protolink.types import RequestSourceType
+from protolink.utils import fastjson
 
 
 class BackendInterface(ABC):
@@ -15,3 +20,68 @@ class BackendInterface(ABC):
 
     @abstractmethod
     async def stop(self) -> None: ...
+
+
+async def wait_until_started(
+    server: Any,
+    server_task: asyncio.Task | None = None,
+    *,
+    timeout: float = 30.0,
+    initial_delay: float = 0.001,
+    max_delay: float = 0.05,
+) -> None:
+    """Wait until a uvicorn server reports it has started.
+
+    The poll interval starts small and doubles up to ``max_delay``, so a fast startup is noticed within a
+    millisecond while a slow one does not wake the event loop every few milliseconds. The whole wait is bounded by a
+    single ``timeout`` deadline, independent of how many polls it takes.
+
+    Raises:
+        RuntimeError: If ``server_task`` finishes before the server has started
+        TimeoutError: If the server has not started within ``timeout`` seconds
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = initial_delay
+    while not server.started:
+        if server_task is not None and server_task.done():
+            cause = None if server_task.cancelled() else server_task.exception()
+            raise RuntimeError("Server stopped before it finished starting") from cause
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Server did not start within {timeout} seconds")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+# ----------------------------------------------------------------------
+# Request payload extraction
+# ----------------------------------------------------------------------
+
+
+async def _read_json_body(request: Any) -> Any:
+    try:
+        return fastjson.loads(await request.body())
+    except ValueError:
+        return None
+
+
+async def _read_query_params(request: Any) -> dict[str, str]:
+    return dict(request.query_params)
+
+
+_PAYLOAD_EXTRACTORS: dict[str, Callable[[Any], Awaitable[Any]]] = {
+    "body": _read_json_body,
+    "query_params": _read_query_params,
+}
+
+
+def payload_extractor(request_source: RequestSourceType) -> Callable[[Any], Awaitable[Any]] | None:
+    """Return the coroutine function that reads an endpoint's raw payload from a request.
+
+    Backends resolve it once per endpoint, so requests do not re-dispatch on ``request_source``.
+
+    Returns:
+        The extractor, or None if the endpoint takes no payload
+    """
+    return _PAYLOAD_EXTRACTORS.get(request_source)
@@ -1,10 +1,10 @@
 import asyncio
-import json
 from typing import Any
 
 from protolink.models import EndpointSpec
 from protolink.transport._deps import _require_fastapi
-from protolink.transport.backends.base import BackendInterface
+from protolink.transport.backends.base import BackendInterface, payload_extractor, wait_until_started
+from protolink.utils import fastjson
 from protolink.utils.inspect import is_async_callable
 
 
@@ -21,39 +21,30 @@ class FastAPIBackend(BackendInterface):
     # ----------------------------------------------------------------------
 
     def _register_endpoint(self, ep: EndpointSpec) -> None:
-        _, Request, JSONResponse, HTMLResponse, _ = _require_fastapi()  # noqa: N806
+        _, Request, Response, HTMLResponse, _ = _require_fastapi()  # noqa: N806
+
+        # Handlers are fixed per endpoint, so inspect them once instead of on every request
+        parser_is_async = ep.request_parser is not None and is_async_callable(ep.request_parser)
+        handler_is_async = is_async_callable(ep.handler)
+        extract_payload = payload_extractor(ep.request_source)
 
         async def route(request: Request):
             # -------------------------
             # Extract raw payload
             # -------------------------
-            if ep.request_source == "body":
-                try:
-                    payload = await request.json()
-                except json.JSONDecodeError:
-                    payload = None
-            elif ep.request_source == "query_params":
-                payload = dict(request.query_params)
-            else:
-                payload = None
+            payload = await extract_payload(request) if extract_payload else None
 
             # -------------------------
             # Parse payload
             # -------------------------
             if ep.request_parser:
-                handler_input = (
-                    await ep.request_parser(payload)
-                    if is_async_callable(ep.request_parser)
-                    else ep.request_parser(payload)
-                )
+                handler_input = await ep.request_parser(payload) if parser_is_async else ep.request_parser(payload)
             else:
                 handler_input = payload
 
             # -------------------------
             # Call handler
             # -------------------------
-            handler_is_async = is_async_callable(ep.handler)
-
             if ep.request_source != "none":
                 result = await ep.handler(handler_input) if handler_is_async else ep.handler(handler_input)
             else:
@@ -65,7 +56,9 @@ class FastAPIBackend(BackendInterface):
             if ep.content_type == "html":
                 return HTMLResponse(content=result)
 
-            return JSONResponse(content=result)
+            # Handlers may return an already encoded document (e.g. the cached agent card)
+            body = result if isinstance(result, bytes) else fastjson.dumps_bytes(result)
+            return Response(content=body, media_type="application/json")
 
         self.app.add_api_route(
             ep.path,
@@ -96,8 +89,12 @@ class FastAPIBackend(BackendInterface):
         self._server_instance = server
         self._server_task = asyncio.create_task(server.serve())
 
-        while not server.started:
-            await asyncio.sleep(0.02)
+        try:
+            await wait_until_started(server, self._server_task)
+        except TimeoutError:
+            # Do not leave a half-started server running in the background
+            server.should_exit = True
+            raise
 
     async def stop(self) -> None:
         if self._server_instance:
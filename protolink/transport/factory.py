@@ -1,18 +1,26 @@
+from importlib import import_module
+
 from protolink.transport.agent.base import AgentTransport
 from protolink.transport.agent.http_transport import HTTPAgentTransport
-from protolink.transport.agent.websocket_transport import WebSocketAgentTransport
 
 _TRANSPORT_REGISTRY: dict[str, type[AgentTransport]] = {
     "http": HTTPAgentTransport,
-    "websocket": WebSocketAgentTransport,
+}
+
+# Transports with heavy dependencies, imported the first time they are requested: name -> (module, class name)
+_LAZY_TRANSPORTS: dict[str, tuple[str, str]] = {
+    "websocket": ("protolink.transport.agent.websocket_transport", "WebSocketAgentTransport"),
 }
 
 
 def get_agent_transport(transport: str, **kwargs) -> AgentTransport:
-    try:
-        transport_class = _TRANSPORT_REGISTRY[transport.lower()]
-    except KeyError:
-        raise ValueError(f"Unknown agent transport name: {transport}") from None
+    name = transport.lower()
+    transport_class = _TRANSPORT_REGISTRY.get(name)
+    if transport_class is None:
+        if name not in _LAZY_TRANSPORTS:
+            raise ValueError(f"Unknown agent transport name: {transport}")
+        module, class_name = _LAZY_TRANSPORTS[name]
+        transport_class = _TRANSPORT_REGISTRY[name] = getattr(import_module(module), class_name)
 
     return transport_class(**kwargs)
 
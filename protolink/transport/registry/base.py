@@ -19,6 +19,14 @@ class RegistryTransport(Transport):
         """Register an agent with the registry."""
         ...
 
+    async def register_many(self, cards: list[AgentCard]) -> None:
+        """Register several agents with the registry.
+
+        Transports with a bulk endpoint should override this; the default registers the cards one by one.
+        """
+        for card in cards:
+            await self.register(card)
+
     @abstractmethod
     async def unregister(self, agent_url: str) -> None:
         """Unregister an agent from the registry."""
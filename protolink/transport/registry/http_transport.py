@@ -4,9 +4,11 @@ from urllib.parse import urlparse
 import httpx
 
 from protolink.models import AgentCard, EndpointSpec
+from protolink.transport.agent.http_transport import HTTP_POOL_LIMITS
 from protolink.transport.backends.starlette import StarletteBackend
 from protolink.transport.registry.base import RegistryTransport
 from protolink.types import TransportType
+from protolink.utils import fastjson
 
 
 class HTTPRegistryTransport(RegistryTransport):
@@ -40,18 +42,22 @@ class HTTPRegistryTransport(RegistryTransport):
         # Start the HTTP server
         await self.backend.start(self.host, self.port)
 
-        # Initialize the HTTP client
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        # Initialize the HTTP client, reusing the pool if a request was already sent before start()
+        await self._ensure_client()
 
     async def stop(self) -> None:
         await self.backend.stop()
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client without touching the server side."""
         if self._client:
             await self._client.aclose()
             self._client = None
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if not self._client:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_POOL_LIMITS)
         return self._client
 
     # ------------------------------------------------------------------
@@ -68,26 +74,20 @@ class HTTPRegistryTransport(RegistryTransport):
             ConnectionError: If registry is not reachable
             RuntimeError: If registration fails for other reasons
         """
-        try:
-            client = await self._ensure_client()
-            response = await client.post(
-                f"{self.url}/agents/",
-                json=card.to_json(),
-            )
-            response.raise_for_status()
-        except httpx.ConnectError as e:
-            raise ConnectionError(
-                f"Failed to connect to registry at {self.url}. Make sure the registry server is running and accessible."
-            ) from e
-        except httpx.RemoteProtocolError as e:
-            raise ConnectionError(
-                f"Protocol error when communicating with registry at {self.url}. "
-                f"The target may not be a proper HTTP server or may be misconfigured."
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise RuntimeError(
-                f"Registry at {self.url} returned HTTP {e.response.status_code}: {e.response.text}"
-            ) from e
+        await self._request("POST", content=card.to_json_bytes(), headers={"Content-Type": "application/json"})
+
+    async def register_many(self, cards: list[AgentCard]) -> None:
+        """Register several agents with the registry in a single request.
+
+        Args:
+            cards: AgentCards to register
+
+        Raises:
+            ConnectionError: If registry is not reachable
+            RuntimeError: If registration fails for other reasons
+        """
+        body = fastjson.dumps_bytes([card.to_json() for card in cards])
+        await self._request("POST", "/agents/batch/", content=body, headers={"Content-Type": "application/json"})
 
     async def unregister(self, agent_url: str) -> None:
         """Unregister an agent from the registry.
@@ -99,26 +99,7 @@ class HTTPRegistryTransport(RegistryTransport):
             ConnectionError: If registry is not reachable
             RuntimeError: If unregistration fails for other reasons
         """
-        try:
-            client = await self._ensure_client()
-            response = await client.delete(
-                f"{self.url}/agents/",
-                params={"agent_url": agent_url},
-            )
-            response.raise_for_status()
-        except httpx.ConnectError as e:
-            raise ConnectionError(
-                f"Failed to connect to registry at {self.url}. Make sure the registry server is running and accessible."
-            ) from e
-        except httpx.RemoteProtocolError as e:
-            raise ConnectionError(
-                f"Protocol error when communicating with registry at {self.url}. "
-                f"The target may not be a proper HTTP server or may be misconfigured."
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise RuntimeError(
-                f"Registry at {self.url} returned HTTP {e.response.status_code}: {e.response.text}"
-            ) from e
+        await self._request("DELETE", params={"agent_url": agent_url})
 
     async def discover(self, filter_by: dict[str, Any] | None = None) -> list[AgentCard]:
         """Discover agents in the registry.
@@ -133,14 +114,42 @@ class HTTPRegistryTransport(RegistryTransport):
             ConnectionError: If registry is not reachable
             RuntimeError: If discovery fails for other reasons
         """
+        response = await self._request("GET", params=filter_by or {})
+        return [AgentCard.from_json(c) for c in fastjson.loads(response.content)]
+
+    # ------------------------------------------------------------------
+    # Server-side handlers (Registry logic)
+    # ------------------------------------------------------------------
+
+    def setup_routes(self, endpoints: list[EndpointSpec]) -> None:
+        """Setup the routes for the HTTP server."""
+
+        self.backend.setup_routes(endpoints)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _request(self, method: str, path: str = "/agents/", **kwargs: Any) -> httpx.Response:
+        """Send a request to one of the registry's endpoints.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path, ``/agents/`` by default
+            **kwargs: Extra arguments forwarded to ``httpx.AsyncClient.request``
+
+        Returns:
+            The successful HTTP response
+
+        Raises:
+            ConnectionError: If registry is not reachable
+            RuntimeError: If the registry returns an error status
+        """
         try:
             client = await self._ensure_client()
-            response = await client.get(
-                f"{self.url}/agents/",
-                params=filter_by or {},
-            )
+            response = await client.request(method, f"{self.url}{path}", **kwargs)
             response.raise_for_status()
-            return [AgentCard.from_json(c) for c in response.json()]
+            return response
         except httpx.ConnectError as e:
             raise ConnectionError(
                 f"Failed to connect to registry at {self.url}. Make sure the registry server is running and accessible."
@@ -155,19 +164,6 @@ class HTTPRegistryTransport(RegistryTransport):
                 f"Registry at {self.url} returned HTTP {e.response.status_code}: {e.response.text}"
             ) from e
 
-    # ------------------------------------------------------------------
-    # Server-side handlers (Registry logic)
-    # ------------------------------------------------------------------
-
-    def setup_routes(self, endpoints: list[EndpointSpec]) -> None:
-        """Setup the routes for the HTTP server."""
-
-        self.backend.setup_routes(endpoints)
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     # TODO(): Do this in the backend
     def _set_from_url(self, url: str) -> None:
         """Populate host, port, and canonical url from a full URL."""
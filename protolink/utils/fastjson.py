@@ -0,0 +1,91 @@
+"""JSON encoding helpers for Protolink.
+
+The helpers use orjson when it is installed (``pip install "protolink[orjson]"``) and fall back to the standard
+library ``json`` module otherwise, so callers never need to care which encoder is available. Inputs orjson handles
+differently from the standard library (non-str dict keys, integers wider than 64 bits) produce the same result with
+either backend.
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# Accept the same non-str dict keys (int, float, bool, None) as the standard library
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+_ORJSON_INDENT_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if orjson is not None else 0
+
+# orjson decodes integers wider than 64 bits as floats, so documents with a run of 19+ digits
+# (every such integer has one) are decoded by the standard library instead
+_LONG_NUMBER = re.compile(r"[0-9]{19}")
+_LONG_NUMBER_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with an indentation of two spaces
+
+    Returns:
+        JSON string representation of the object
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only the standard library can encode
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 encoded JSON, ready to be sent over the wire.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON document
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only the standard library can encode
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as text or UTF-8 encoded bytes
+
+    Returns:
+        The decoded object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        long_number = _LONG_NUMBER if isinstance(data, str) else _LONG_NUMBER_BYTES
+        if long_number.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
@@ -3,6 +3,7 @@
 This module provides functions for generating various types of IDs used in Protolink.
 """
 
+import os
 import uuid
 from datetime import datetime
 
@@ -36,7 +37,7 @@ class IDGenerator:
             A unique message ID string
         """
         prefix = prefix or cls.MSG_PREFIX
-        return f"{prefix}{IDGenerator._generate_timestamp()}_{uuid.uuid4().hex[:8]}"
+        return f"{prefix}{IDGenerator._generate_timestamp()}_{IDGenerator._random_suffix(4)}"
 
     @classmethod
     def generate_task_id(cls, prefix: str | None = None) -> str:
@@ -49,7 +50,7 @@ class IDGenerator:
             A unique task ID string
         """
         prefix = prefix or cls.TASK_PREFIX
-        return f"{prefix}{IDGenerator._generate_timestamp()}_{uuid.uuid4().hex[:8]}"
+        return f"{prefix}{IDGenerator._generate_timestamp()}_{IDGenerator._random_suffix(4)}"
 
     @classmethod
     def generate_context_id(cls, prefix: str | None = None) -> str:
@@ -62,7 +63,7 @@ class IDGenerator:
             A unique context ID string
         """
         prefix = prefix or cls.CTX_PREFIX
-        return f"{prefix}{IDGenerator._generate_timestamp()}_{uuid.uuid4().hex[:6]}"
+        return f"{prefix}{IDGenerator._generate_timestamp()}_{IDGenerator._random_suffix(3)}"
 
     @classmethod
     def generate_artifact_id(cls, prefix: str | None = None) -> str:
@@ -75,7 +76,15 @@ class IDGenerator:
             A unique artifact ID string
         """
         prefix = prefix or cls.ARTIFACT_PREFIX
-        return f"{prefix}{IDGenerator._generate_timestamp()}_{uuid.uuid4().hex[:8]}"
+        return f"{prefix}{IDGenerator._generate_timestamp()}_{IDGenerator._random_suffix(4)}"
+
+    @staticmethod
+    def _random_suffix(num_bytes: int) -> str:
+        """Generate a random hex suffix of ``2 * num_bytes`` characters.
+
+        Reads the bytes straight from ``os.urandom`` instead of building a full UUID4 only to slice it.
+        """
+        return os.urandom(num_bytes).hex()
 
     @staticmethod
     def _generate_timestamp() -> str:
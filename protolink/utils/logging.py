@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import sys
+from dataclasses import dataclass
 from logging.handlers import RotatingFileHandler
 from typing import Any
 
@@ -67,11 +68,30 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             data["exc_info"] = self.formatException(record.exc_info)
 
+        # Log output must not depend on whether orjson is installed, so the standard library encoder is used here
         return json.dumps(data, ensure_ascii=False)
 
 
-def _resolve_log_level(default_level: int) -> int:
-    env_level = os.getenv(_ENV_LOG_LEVEL)
+@dataclass(frozen=True)
+class _EnvConfig:
+    """Snapshot of the logging environment variables."""
+
+    log_level: str | None
+    log_file: str | None
+    use_json: bool
+
+    @classmethod
+    def from_env(cls) -> "_EnvConfig":
+        log_format = os.getenv(_ENV_LOG_FORMAT)
+        return cls(
+            log_level=os.getenv(_ENV_LOG_LEVEL) or None,
+            log_file=os.getenv(_ENV_LOG_FILE),
+            use_json=bool(log_format) and log_format.lower() in {"json", "structured"},
+        )
+
+
+def _resolve_log_level(env: _EnvConfig, default_level: int) -> int:
+    env_level = env.log_level
     if not env_level:
         return default_level
 
@@ -81,18 +101,10 @@ def _resolve_log_level(default_level: int) -> int:
     return default_level
 
 
-def _resolve_log_file(explicit_file: str | None) -> str | None:
+def _resolve_log_file(env: _EnvConfig, explicit_file: str | None) -> str | None:
     if explicit_file is not None:
         return explicit_file
-    return os.getenv(_ENV_LOG_FILE)
-
-
-def _use_json_format() -> bool:
-    value = os.getenv(_ENV_LOG_FORMAT)
-    if not value:
-        return False
-    value = value.lower()
-    return value in {"json", "structured"}
+    return env.log_file
 
 
 class ProtoLinkLogger:
@@ -119,15 +131,17 @@ class ProtoLinkLogger:
             max_bytes: Maximum log file size in bytes before rotation
             backup_count: Number of backup log files to keep
         """
-        resolved_level = _resolve_log_level(log_level)
-        resolved_file = _resolve_log_file(log_file)
+        # The environment is read once per logger, so variables set after import still apply
+        env = _EnvConfig.from_env()
+        resolved_level = _resolve_log_level(env, log_level)
+        resolved_file = _resolve_log_file(env, log_file)
 
         self.logger = logging.getLogger(name)
         self.logger.setLevel(resolved_level)
 
         # Prevent adding multiple handlers
         if not self.logger.handlers:
-            if _use_json_format():
+            if env.use_json:
                 formatter: logging.Formatter = JsonFormatter(datefmt=DATE_FORMAT)
             else:
                 formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
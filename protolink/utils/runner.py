@@ -0,0 +1,51 @@
+"""Event loop runner for Protolink applications.
+
+This module provides :func:`run`, a drop-in replacement for :func:`asyncio.run`
+that uses uvloop when it is installed.
+"""
+
+import asyncio
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory, or None if uvloop is not installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T], *, eager_tasks: bool = False) -> T:
+    """Run a coroutine to completion, like :func:`asyncio.run`.
+
+    The coroutine runs on a uvloop event loop when uvloop is installed
+    (``pip install "protolink[uvloop]"``) and on the default asyncio loop otherwise.
+
+    Args:
+        main: Coroutine to run
+        eager_tasks: Start new tasks eagerly (Python 3.12+), so coroutines that finish without suspending, such as
+            in-memory agent calls, never go through the scheduler. Ignored on older Python versions.
+
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = _uvloop_factory()
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            if eager_tasks and sys.version_info >= (3, 12):
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            return runner.run(main)
+
+    # Python 3.10 has no asyncio.Runner; fall back to installing uvloop's policy
+    if loop_factory is not None:
+        import uvloop
+
+        uvloop.install()
+    return asyncio.run(main)
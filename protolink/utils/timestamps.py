@@ -0,0 +1,32 @@
+"""Timestamp utilities for Protolink.
+
+This module provides the ISO 8601 timestamps stamped on tasks, events and contexts.
+"""
+
+import time
+from datetime import datetime, timezone
+
+# Timestamps requested within this many seconds of each other share one formatted string
+_RESOLUTION = 0.001
+
+# (epoch seconds, formatted timestamp) of the last call
+_last: tuple[float, str] = (float("-inf"), "")
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat()``, except that calls made within the same millisecond
+    reuse the previously formatted string instead of building a new datetime each time.
+
+    Returns:
+        ISO 8601 timestamp with a UTC offset, e.g. ``"2025-01-01T12:00:00.000123+00:00"``
+    """
+    global _last
+    now = time.time()
+    stamped_at, stamp = _last
+    if 0 <= now - stamped_at < _RESOLUTION:
+        return stamp
+    stamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _last = (now, stamp)
+    return stamp
@@ -14,9 +14,9 @@ from protolink.core.task import Task
 class Validator:
     """Validation helper class for Protolink objects and identifiers."""
 
-    # Regex patterns for validation
-    ID_PATTERN = r"^[a-zA-Z0-9_-]{1,64}$"
-    CONTEXT_ID_PATTERN = r"^[a-zA-Z0-9_-]{1,128}$"
+    # Regex patterns for validation, compiled once at import time
+    ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+    CONTEXT_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,128}$")
 
     @classmethod
     def validate_agent_card(cls, agent_card: AgentCard) -> tuple[bool, str]:
@@ -118,12 +118,12 @@ class Validator:
     @classmethod
     def _is_valid_id(cls, id_str: str) -> bool:
         """Check if a string is a valid ID."""
-        return bool(re.match(cls.ID_PATTERN, id_str))
+        return bool(cls.ID_PATTERN.match(id_str))
 
     @classmethod
     def _is_valid_context_id(cls, context_id: str) -> bool:
         """Check if a string is a valid context ID."""
-        return bool(re.match(cls.CONTEXT_ID_PATTERN, context_id))
+        return bool(cls.CONTEXT_ID_PATTERN.match(context_id))
 
     @staticmethod
     def _is_valid_uuid(uuid_str: str) -> bool:
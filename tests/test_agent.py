@@ -1,6 +1,7 @@
 """Tests for the Agent class."""
 
 import asyncio
+import json
 from typing import ClassVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -111,6 +112,35 @@ class TestAgent:
         """Test get_agent_card returns the correct card."""
         assert agent.get_agent_card(as_json=False) == agent_card
 
+    def test_get_agent_card_json_is_independent(self, agent):
+        """Test each call returns a fresh dict, so editing one does not leak into the card or the encoded card."""
+        card_json = agent.get_agent_card()
+        card_json["name"] = "changed"
+
+        assert agent.get_agent_card()["name"] == agent.card.name
+        assert json.loads(agent.get_agent_card_bytes())["name"] == agent.card.name
+
+    def test_get_agent_card_bytes_refreshed_on_new_skill(self, agent):
+        """Test the encoded card picks up skills added through the agent."""
+        card_bytes = agent.get_agent_card_bytes()
+
+        @agent.tool("ping", "Ping")
+        def ping():
+            return "pong"
+
+        refreshed = agent.get_agent_card_bytes()
+        assert refreshed is not card_bytes
+        assert "ping" in [skill["id"] for skill in json.loads(refreshed)["skills"]]
+
+    def test_get_agent_card_bytes(self, agent):
+        """Test the encoded card is cached until the card cache is cleared."""
+        card_bytes = agent.get_agent_card_bytes()
+        assert json.loads(card_bytes) == agent.get_agent_card()
+        assert agent.get_agent_card_bytes() is card_bytes
+
+        agent.clear_card_cache()
+        assert agent.get_agent_card_bytes() is not card_bytes
+
     @pytest.mark.asyncio
     async def test_handle_task_not_implemented(self, agent):
         """Test handle_task raises NotImplementedError by default."""
@@ -158,6 +188,35 @@ class TestAgent:
             task,
         )
 
+    @pytest.mark.asyncio
+    async def test_send_tasks_to(self, agent):
+        """Test fanning tasks out to several agents, with failures reported in place."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_task(agent_url, task):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if agent_url == "http://down.local":
+                raise ConnectionError("unreachable")
+            return task
+
+        transport = DummyTransport()
+        transport.send_task = send_task
+        agent.set_transport(transport)
+
+        tasks = [Task.create(Message.user(str(i))) for i in range(4)]
+        urls = ["http://a.local", "http://down.local", "http://b.local", "http://c.local"]
+        results = await agent.send_tasks_to(zip(urls, tasks), max_concurrency=2)
+
+        assert results[0] is tasks[0]
+        assert isinstance(results[1], ConnectionError)
+        assert results[2:] == tasks[2:]
+        assert max_in_flight == 2
+
     @pytest.mark.asyncio
     async def test_send_message_to(self, agent):
         """Test sending a message to another agent."""
@@ -264,6 +323,62 @@ class TestAgent:
         result = await agent.call_tool("test_tool", arg1="value1")
         assert result == "Tool result: {'arg1': 'value1'}"
 
+    @pytest.mark.asyncio
+    async def test_call_cacheable_tool(self, agent):
+        """Test results of cacheable tools are memoized per argument set."""
+        calls = []
+
+        @agent.tool("add", "Add two numbers", cacheable=True)
+        async def add(a: int, b: int) -> int:
+            calls.append((a, b))
+            return a + b
+
+        assert await agent.call_tool("add", a=1, b=2) == 3
+        assert await agent.call_tool("add", b=2, a=1) == 3
+        assert await agent.call_tool("add", a=2, b=2) == 4
+        assert calls == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_call_cacheable_tool_keys_on_argument_type(self, agent):
+        """Test arguments that compare equal but differ in type (1, True, 1.0) are cached separately."""
+
+        @agent.tool("describe", "Describe the input", cacheable=True)
+        async def describe(x) -> str:
+            return repr(x)
+
+        assert await agent.call_tool("describe", x=1) == "1"
+        assert await agent.call_tool("describe", x=True) == "True"
+        assert await agent.call_tool("describe", x=1.0) == "1.0"
+        assert await agent.call_tool("describe", x=1) == "1"
+
+    @pytest.mark.asyncio
+    async def test_call_cacheable_tool_unhashable_arguments(self, agent):
+        """Test calls with unhashable arguments bypass the cache."""
+        calls = []
+
+        @agent.tool("total", "Sum the values", cacheable=True)
+        async def total(values: list) -> int:
+            calls.append(values)
+            return sum(values)
+
+        assert await agent.call_tool("total", values=[1, 2]) == 3
+        assert await agent.call_tool("total", values=[1, 2]) == 3
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_not_cached_by_default(self, agent):
+        """Test tools are invoked on every call unless marked cacheable."""
+        calls = []
+
+        @agent.tool("echo", "Echo the input")
+        async def echo(text: str) -> str:
+            calls.append(text)
+            return text
+
+        await agent.call_tool("echo", text="hi")
+        await agent.call_tool("echo", text="hi")
+        assert calls == ["hi", "hi"]
+
     def test_call_tool_not_found(self, agent):
         """Test calling a non-existent tool."""
         with pytest.raises(ValueError, match="Tool nonexistent not found"):
@@ -330,11 +445,40 @@ class TestAgent:
         assert events[0].new_state == "working"
         assert events[-1].new_state == "completed"
 
+    @pytest.mark.asyncio
+    async def test_handle_task_streaming_default_async_handler(self, agent):
+        """Test default streaming awaits an async handle_task."""
+
+        class TestAgent(Agent):
+            async def handle_task(self, task):
+                return task.complete("Test response")
+
+        test_agent = TestAgent(agent.card)
+        events = [event async for event in test_agent.handle_task_streaming(Task.create(Message.user("test")))]
+
+        assert [event.new_state for event in events] == ["working", "completed"]
+
     def test_get_context_manager(self, agent):
         """Test getting the context manager."""
         context_manager = agent.get_context_manager()
         assert context_manager == agent.context_manager
 
+    @pytest.mark.asyncio
+    async def test_create_validates_llm(self, agent_card):
+        """Test the async factory attaches the LLM and validates it off the event loop."""
+        llm = DummyLLM()
+        agent = await Agent.create(agent_card, llm=llm)
+
+        assert agent.llm is llm
+        assert agent.card.capabilities.has_llm is True
+        assert agent.get_agent_card()["capabilities"]["has_llm"] is True
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_positional_llm(self, agent_card):
+        """Test the async factory refuses an LLM passed positionally, which would skip the off-loop validation."""
+        with pytest.raises(TypeError):
+            await Agent.create(agent_card, None, None, DummyLLM())
+
     def test_set_llm(self, agent):
         """Test setting the LLM."""
         llm = DummyLLM()
@@ -1,5 +1,7 @@
 """Tests for the AgentCard class."""
 
+import json
+
 from protolink.core.agent_card import AgentCapabilities, AgentCard
 
 
@@ -57,6 +59,13 @@ def test_to_json():
     assert json_data["securitySchemes"] == {"bearer": {"type": "http", "scheme": "bearer"}}
 
 
+def test_to_json_bytes_round_trip():
+    """Test the encoded card decodes back to the same card."""
+    card = AgentCard(name="bytes-agent", description="Agent for bytes testing", url="http://bytes-test.local")
+
+    assert AgentCard.from_json(json.loads(card.to_json_bytes())) == card
+
+
 def test_from_json():
     """Test creation from JSON data."""
     json_data = {
@@ -0,0 +1,22 @@
+"""Tests for the Artifact class."""
+
+from datetime import datetime, timedelta
+
+from protolink.core.artifact import Artifact
+
+
+def test_created_at_is_utc_with_offset():
+    """Test artifacts are stamped in UTC with an explicit offset, like tasks and events."""
+    artifact = Artifact()
+
+    assert artifact.created_at.endswith("+00:00")
+    assert datetime.fromisoformat(artifact.created_at).utcoffset() == timedelta(0)
+
+
+def test_created_at_round_trip():
+    """Test serialized timestamps are preserved as-is, whichever format the sender used."""
+    naive = "2025-01-01T12:00:00.000123"
+    artifact = Artifact.from_dict(Artifact(created_at=naive).to_dict())
+
+    assert artifact.created_at == naive
+    assert Artifact.from_dict(Artifact().to_dict()).created_at.endswith("+00:00")
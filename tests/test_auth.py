@@ -0,0 +1,20 @@
+"""Tests for the authentication providers."""
+
+import pytest
+
+from protolink.security.auth import APIKeyAuth
+
+
+@pytest.mark.asyncio
+async def test_api_key_auth():
+    """Test API keys authenticate with their scopes and are exposed read-only."""
+    auth = APIKeyAuth({"key-123": ["read", "write"]})
+
+    context = await auth.authenticate("key-123")
+    assert context.has_scope("write")
+    assert auth.valid_keys == {"key-123": ["read", "write"]}
+
+    with pytest.raises(TypeError):
+        auth.valid_keys["key-456"] = ["read"]
+    with pytest.raises(Exception, match="Invalid API key"):
+        await auth.authenticate("key-456")
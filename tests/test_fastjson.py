@@ -0,0 +1,54 @@
+"""Tests for the fastjson helpers."""
+
+import json
+
+import pytest
+
+from protolink.utils import fastjson
+
+BIG_INT = 2**70
+
+PAYLOADS = [
+    {"name": "agent", "tags": ["a", "b"], "nested": {"ok": True, "ratio": 0.5}},
+    {1: "one", 2: {3: None}},
+    {"id": BIG_INT, "values": [-BIG_INT, 1]},
+    {"text": "héllo ✓"},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the standard library fallback."""
+    if request.param == "orjson":
+        if not fastjson.HAS_ORJSON:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(fastjson, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_dumps_matches_stdlib(backend, payload):
+    """Test both backends encode to the same document as the standard library."""
+    expected = json.loads(json.dumps(payload))
+
+    assert json.loads(fastjson.dumps(payload)) == expected
+    assert json.loads(fastjson.dumps(payload, indent=True)) == expected
+    assert json.loads(fastjson.dumps_bytes(payload)) == expected
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_round_trip(backend, payload):
+    """Test encoded documents decode to the same values on both backends."""
+    expected = json.loads(json.dumps(payload))
+
+    assert fastjson.loads(fastjson.dumps_bytes(payload)) == expected
+    assert fastjson.loads(fastjson.dumps(payload)) == expected
+
+
+def test_loads_keeps_big_ints_exact(backend):
+    """Test integers wider than 64 bits are not decoded as floats."""
+    decoded = fastjson.loads(f'{{"id": {BIG_INT}}}'.encode())
+
+    assert decoded["id"] == BIG_INT
+    assert isinstance(decoded["id"], int)
@@ -0,0 +1,31 @@
+"""Tests for the HTTPAgentTransport class."""
+
+import httpx
+import pytest
+
+from protolink.transport import HTTPAgentTransport
+
+
+@pytest.mark.asyncio
+async def test_warmup_requests_each_agent_once():
+    """Test warmup fetches each distinct agent card once and ignores unreachable agents."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.host == "down.local":
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport = HTTPAgentTransport(url="http://127.0.0.1:8992", client=client)
+
+    try:
+        await transport.warmup(["http://a.local:8000", "http://a.local:8000/", "http://down.local:8000"])
+    finally:
+        await client.aclose()
+
+    assert sorted(requested) == [
+        "http://a.local:8000/.well-known/agent.json",
+        "http://down.local:8000/.well-known/agent.json",
+    ]
@@ -0,0 +1,29 @@
+"""Tests for the Protolink logging utilities."""
+
+import logging
+
+from protolink.utils.logging import JsonFormatter, get_logger
+
+
+def test_environment_read_when_logger_is_created(monkeypatch):
+    """Test PROTOLINK_LOG_* variables set after import apply to loggers created afterwards."""
+    monkeypatch.setenv("PROTOLINK_LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("PROTOLINK_LOG_FORMAT", "json")
+
+    logger = get_logger("protolink.tests.late_env").logger
+    try:
+        assert logger.level == logging.DEBUG
+        assert isinstance(logger.handlers[0].formatter, JsonFormatter)
+    finally:
+        logger.handlers.clear()
+
+
+def test_json_formatter_output_format():
+    """Test structured log lines keep the standard library's separators."""
+    record = logging.LogRecord("protolink.tests", logging.INFO, __file__, 1, "héllo", None, None)
+    record.request_id = 7
+
+    line = JsonFormatter().format(record)
+
+    assert '"message": "héllo"' in line
+    assert line.endswith('"extra": {"request_id": 7}}')
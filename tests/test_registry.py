@@ -5,8 +5,10 @@ import time
 from typing import Any
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
+from protolink.client import RegistryClient
 from protolink.discovery.registry import Registry
 from protolink.models import AgentCard
 from protolink.transport import HTTPRegistryTransport, RegistryTransport
@@ -223,6 +225,39 @@ class TestRegistry:
         await registry.handle_unregister("http://nonexistent.local")
         assert registry.count() == 0
 
+    @pytest.mark.asyncio
+    async def test_handle_register_many(self, dummy_transport, agent_card, agent_card2):
+        """Test registering a batch of agents releases waiters at once."""
+        registry = Registry(transport=dummy_transport)
+
+        waiter = asyncio.create_task(registry.wait_for_agents(2, timeout=1))
+        await registry.handle_register_many([agent_card, agent_card2])
+        await waiter
+
+        assert registry.list_urls() == [agent_card.url, agent_card2.url]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_agents(self, dummy_transport, agent_card, agent_card2):
+        """Test waiters are released once enough agents registered."""
+        registry = Registry(transport=dummy_transport)
+
+        waiter = asyncio.create_task(registry.wait_for_agents(2, timeout=1))
+        await registry.handle_register(agent_card)
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await registry.handle_register(agent_card2)
+        await waiter
+
+    @pytest.mark.asyncio
+    async def test_wait_for_agents_timeout(self, dummy_transport, agent_card):
+        """Test waiting for more agents than register times out."""
+        registry = Registry(transport=dummy_transport)
+        await registry.handle_register(agent_card)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await registry.wait_for_agents(2, timeout=0.01)
+
     @pytest.mark.asyncio
     async def test_handle_discover_no_filter(self, dummy_transport, agent_card, agent_card2):
         """Test server-side discover handler without filter."""
@@ -408,3 +443,198 @@ class TestRegistry:
         filter_by = {"name": "agent1", "version": "2.0.0"}
         result = asyncio.run(registry.handle_discover(filter_by, as_json=False))
         assert len(result) == 0
+
+    def test_filter_by_nested_attribute(self, dummy_transport):
+        """Test filtering agents by a dotted path into the card's capabilities."""
+        registry = Registry(transport=dummy_transport)
+
+        streaming = AgentCard(name="streaming", description="desc", url="http://streaming.local")
+        streaming.capabilities.streaming = True
+        plain = AgentCard(name="plain", description="desc", url="http://plain.local")
+
+        asyncio.run(registry.handle_register_many([streaming, plain]))
+
+        result = asyncio.run(registry.handle_discover({"capabilities.streaming": True}, as_json=False))
+        assert result == [streaming]
+
+        # Query parameters arrive as strings
+        result = asyncio.run(registry.handle_discover({"capabilities.streaming": "false"}, as_json=False))
+        assert result == [plain]
+
+        result = asyncio.run(registry.handle_discover({"capabilities.nonexistent": "true"}, as_json=False))
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_capability_index_follows_registrations(self, dummy_transport):
+        """Test capability lookups reflect re-registrations and unregistrations."""
+        registry = Registry(transport=dummy_transport)
+        card = AgentCard(name="agent", description="desc", url="http://agent.local")
+        card.capabilities.streaming = True
+        await registry.handle_register(card)
+
+        assert await registry.handle_discover({"capabilities.streaming": "true"}, as_json=False) == [card]
+
+        updated = AgentCard(name="agent", description="desc", url="http://agent.local")
+        updated.capabilities.rag = True
+        await registry.handle_register(updated)
+        assert await registry.handle_discover({"capabilities.streaming": True}, as_json=False) == []
+        assert await registry.handle_discover({"capabilities.rag": True}, as_json=False) == [updated]
+
+        await registry.handle_unregister(updated.url)
+        assert await registry.handle_discover({"capabilities.rag": True}, as_json=False) == []
+
+    @pytest.mark.asyncio
+    async def test_capability_index_rechecks_live_card(self, dummy_transport):
+        """Test indexed lookups agree with the full scan when a registered card is edited in place."""
+        registry = Registry(transport=dummy_transport)
+        card = AgentCard(name="agent", description="desc", url="http://agent.local")
+        card.capabilities.streaming = True
+        await registry.handle_register(card)
+
+        card.capabilities.streaming = False
+        assert await registry.handle_discover({"capabilities.streaming": True}, as_json=False) == []
+        assert await registry.handle_discover({"capabilities.streaming": True, "name": "agent"}, as_json=False) == []
+
+        card.capabilities.rag = True
+        await registry.handle_register(card)
+        assert await registry.handle_discover({"capabilities.rag": True}, as_json=False) == [card]
+
+
+class TestRegistryClient:
+    """Test cases for the RegistryClient discovery cache."""
+
+    @pytest.fixture
+    def agent_card(self):
+        """Create a test agent card."""
+        return AgentCard(name="test-agent", description="A test agent", url="http://test-agent.local")
+
+    @pytest.mark.asyncio
+    async def test_discover_is_cached(self, agent_card):
+        """Test repeated discovery within the TTL hits the transport once."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport, cache_ttl=20)
+
+        first = await client.discover()
+        second = await client.discover()
+
+        assert first == second == [agent_card]
+        transport.discover.assert_awaited_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_discover_cache_keyed_by_filter(self, agent_card):
+        """Test different filters are cached independently."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport, cache_ttl=20)
+
+        await client.discover({"name": "test-agent"})
+        await client.discover({"name": "other"})
+        await client.discover({"name": "test-agent"})
+
+        assert transport.discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discover_not_cached_by_default(self, agent_card):
+        """Test discovery always queries the registry unless a TTL is configured."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport)
+
+        await client.discover()
+        await client.discover()
+
+        assert transport.discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discover_cache_expires(self, agent_card):
+        """Test a zero TTL disables caching."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport, cache_ttl=0)
+
+        await client.discover()
+        await client.discover()
+
+        assert transport.discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_register_invalidates_cache(self, agent_card):
+        """Test registering or unregistering drops cached discovery results."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport, cache_ttl=20)
+
+        await client.discover()
+        await client.register(agent_card)
+        await client.discover()
+        await client.unregister(agent_card.url)
+        await client.discover()
+
+        assert transport.discover.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_discover_failure_not_cached(self, agent_card):
+        """Test failed lookups are retried instead of cached."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(side_effect=[ConnectionError("down"), [agent_card]])
+        client = RegistryClient(transport, cache_ttl=20)
+
+        with pytest.raises(ConnectionError):
+            await client.discover()
+
+        assert await client.discover() == [agent_card]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_discover_coalesced(self, agent_card):
+        """Test concurrent lookups for the same filter share one registry request."""
+        transport = DummyRegistryTransport()
+
+        async def slow_discover(filter_by=None):
+            await asyncio.sleep(0.01)
+            return [agent_card]
+
+        transport.discover = AsyncMock(side_effect=slow_discover)
+        client = RegistryClient(transport, cache_ttl=0)
+
+        results = await asyncio.gather(*(client.discover() for _ in range(5)))
+
+        assert all(result == [agent_card] for result in results)
+        transport.discover.assert_awaited_once_with(None)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_find_by_capability(self, agent_card):
+        """Test capability lookups are sent to the registry as a filter."""
+        transport = DummyRegistryTransport()
+        transport.discover = AsyncMock(return_value=[agent_card])
+        client = RegistryClient(transport, cache_ttl=20)
+
+        assert await client.find_by_capability("streaming") == [agent_card]
+        assert await client.find_by_capability("streaming") == [agent_card]
+        transport.discover.assert_awaited_once_with({"capabilities.streaming": True})
+
+    @pytest.mark.asyncio
+    async def test_register_many_over_http(self, agent_card):
+        """Test remote agents can be registered in bulk through the registry's HTTP endpoint."""
+        registry_url = "http://127.0.0.1:8993"
+        registry = Registry(transport=HTTPRegistryTransport(url=registry_url))
+        registry._server._build_endpoints()
+
+        transport = HTTPRegistryTransport(url=registry_url)
+        requests = []
+
+        async def record(request):
+            requests.append(request)
+
+        app = registry._server._transport.app
+        transport._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), event_hooks={"request": [record]})
+        other = AgentCard(name="other-agent", description="Another agent", url="http://other-agent.local")
+
+        try:
+            await RegistryClient(transport).register_many([agent_card, other])
+        finally:
+            await transport.close()
+
+        assert len(requests) == 1
+        assert await registry.handle_discover(as_json=False) == [agent_card, other]
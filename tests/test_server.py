@@ -0,0 +1,78 @@
+"""Tests for the AgentServer class."""
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from protolink.agents import Agent
+from protolink.core.agent_card import AgentCard
+from protolink.core.message import Message
+from protolink.core.task import Task
+from protolink.server import AgentServer
+from protolink.transport import HTTPAgentTransport
+
+AGENT_URL = "http://127.0.0.1:8990"
+
+
+class SyncAgent:
+    """Agent whose handle_task is a plain function."""
+
+    def handle_task(self, task: Task) -> Task:
+        return task.complete("sync response")
+
+
+class AsyncAgent:
+    """Agent whose handle_task is a coroutine function."""
+
+    async def handle_task(self, task: Task) -> Task:
+        return task.complete("async response")
+
+
+class EchoAgent(Agent):
+    """Agent that returns the task it receives unchanged."""
+
+    async def handle_task(self, task: Task) -> Task:
+        return task
+
+
+class TestAgentServer:
+    """Test cases for AgentServer."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("agent", "expected"),
+        [(SyncAgent(), "sync response"), (AsyncAgent(), "async response")],
+    )
+    async def test_task_handler(self, agent, expected):
+        """Test tasks are handled by both synchronous and asynchronous agents."""
+        server = AgentServer(MagicMock(), agent)
+        task = Task.create(Message.user("Hello"))
+
+        result = await server.task_handler(task)
+
+        assert result["state"] == "completed"
+        assert result["messages"][-1]["parts"][0]["content"] == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["starlette", "fastapi"])
+    async def test_http_task_round_trip(self, backend):
+        """Test task metadata survives the HTTP wire format, including int keys and big integers."""
+        server_transport = HTTPAgentTransport(url=AGENT_URL, backend=backend)
+        agent = EchoAgent(AgentCard(name="echo", description="Echo agent", url=AGENT_URL), transport=server_transport)
+        agent.server._build_endpoints()
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server_transport.backend.app))
+        client_transport = HTTPAgentTransport(url="http://127.0.0.1:8991", client=client)
+        task = Task.create(Message.user("Hello"))
+        task.metadata = {1: "one", "big": 2**70}
+
+        try:
+            result = await client_transport.send_task(AGENT_URL, task)
+            card = await client_transport.get_agent_card(AGENT_URL)
+        finally:
+            await client.aclose()
+
+        assert result.id == task.id
+        assert result.metadata == {"1": "one", "big": 2**70}
+        assert card.name == "echo"